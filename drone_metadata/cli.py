@@ -3,23 +3,31 @@ Command-line interface for drone metadata automation system.
 """
 
 import click
+import jinja2
 import logging
 import json
+import math
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 from .processor import DroneMetadataProcessor, ProcessingError
 from .models import FlightReport
 from .ingestion.video_metadata_parser import VideoMetadataParser
 from .formatters.base_formatter import FormatterConfig
-from .formatters.markdown_formatter import MarkdownFormatter
-from .formatters.semantic_model_exporter import SemanticModelExporter
-from .formatters.thumbnail_generator import ThumbnailGenerator
-from .formatters.directory_organizer import DirectoryOrganizer
 from .analysis.mission_classifier import MissionClassifier
 
+# Optional fast JSON encoder with graceful fallback to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +37,34 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Summary templates shared by the command bodies
+_TPL_PROCESS_SUMMARY = (
+    "\n✅ Processing completed successfully!\n"
+    "📊 Flight ID: {flight_id}\n"
+    "🏗️  Bay: {bay}\n"
+    "📈 Quality Score: {grade} ({score:.2f})\n"
+    "⏱️  Processing Time: {processing_seconds:.1f}s\n"
+    "📁 Output: {output}"
+)
+_TPL_BATCH_SUMMARY = (
+    "\n✅ Batch processing completed!\n"
+    "📊 Processed: {count} flight directories\n"
+    "📁 Output directory: {output}\n"
+    "📈 Quality distribution: {grades}\n"
+    "🚨 Total anomalies detected: {anomalies}"
+)
+_TPL_VIDEOS_SUMMARY = (
+    "\n✅ Processing complete!\n"
+    "   📊 Successfully processed: {processed}\n"
+    "   ❌ Failed: {failed}\n"
+    "   📁 Output directory: {output}"
+)
+_TPL_ERROR = "❌ Error: {}"
+_TPL_UNEXPECTED_ERROR = "❌ Unexpected error: {}"
+
+# Quality rating badges, indexed by whether a component score passes the threshold
+_QUALITY_BADGES = ('⚠️', '✓')
+
 
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
@@ -96,12 +132,16 @@ def process(ctx, input_directory, output, format):
         _write_report(report, output_path, format)
         
         # Print summary
-        click.echo(f"\n✅ Processing completed successfully!")
-        click.echo(f"📊 Flight ID: {report.flight_id}")
-        click.echo(f"🏗️  Bay: {report.bay_mapping.bay_id if report.bay_mapping else 'Unknown'}")
-        click.echo(f"📈 Quality Score: {report.quality_score.get_grade()} ({report.quality_score.overall_score:.2f})")
-        click.echo(f"⏱️  Processing Time: {report.processing_time.total_seconds():.1f}s")
-        click.echo(f"📁 Output: {output_path}")
+        bm = report.bay_mapping
+        qs = report.quality_score
+        click.echo(_TPL_PROCESS_SUMMARY.format(
+            flight_id=report.flight_id,
+            bay=bm.bay_id if bm else 'Unknown',
+            grade=qs.grade,
+            score=qs.overall_score,
+            processing_seconds=report.processing_time.total_seconds(),
+            output=output_path
+        ))
         
         if report.human_verification_needed:
             click.echo(f"⚠️  Human verification needed: {', '.join(report.human_verification_needed)}")
@@ -113,11 +153,11 @@ def process(ctx, input_directory, output, format):
         
     except ProcessingError as e:
         logger.error(f"Processing failed: {e}")
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
-        click.echo(f"❌ Unexpected error: {e}", err=True)
+        click.echo(_TPL_UNEXPECTED_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -155,41 +195,39 @@ def batch(ctx, parent_directory, output_dir, format, summary):
             click.echo("❌ No flight directories found or processed successfully")
             return
         
-        # Write individual reports
+        # Write individual reports, tallying grades and anomalies on the way
+        grade_counts = Counter()
+        total_anomalies = 0
         for report in reports:
             filename = f"flight_report_{report.flight_id}.{format}"
             report_path = output_path / filename
             _write_report(report, report_path, format)
+            grade_counts[report.quality_score.grade] += 1
+            total_anomalies += len(report.anomalies)
         
         # Generate summary if requested
         if summary:
             summary_data = _generate_batch_summary(reports)
             summary_path = output_path / f"batch_summary.json"
             
-            with open(summary_path, 'w') as f:
-                json.dump(summary_data, f, indent=2, default=str)
+            with open(summary_path, 'wb') as f:
+                f.write(_dump_json(summary_data))
         
         # Print results
-        click.echo(f"\n✅ Batch processing completed!")
-        click.echo(f"📊 Processed: {len(reports)} flight directories")
-        click.echo(f"📁 Output directory: {output_path}")
-        
-        # Quality distribution
-        grades = [r.quality_score.get_grade() for r in reports]
-        grade_counts = {g: grades.count(g) for g in set(grades)}
-        click.echo(f"📈 Quality distribution: {dict(sorted(grade_counts.items()))}")
-        
-        # Anomaly summary
-        total_anomalies = sum(len(r.anomalies) for r in reports)
-        click.echo(f"🚨 Total anomalies detected: {total_anomalies}")
+        click.echo(_TPL_BATCH_SUMMARY.format(
+            count=len(reports),
+            output=output_path,
+            grades=dict(sorted(grade_counts.items())),
+            anomalies=total_anomalies
+        ))
         
     except ProcessingError as e:
         logger.error(f"Batch processing failed: {e}")
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
-        click.echo(f"❌ Unexpected error: {e}", err=True)
+        click.echo(_TPL_UNEXPECTED_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -248,7 +286,7 @@ def scan(ctx, directory):
         
     except Exception as e:
         logger.error(f"Scan failed: {e}")
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -305,6 +343,9 @@ def process_videos(ctx, input_path, output, format, organize, parallel, classify
     - Mission-based directory organization
     """
     try:
+        from .formatters import MarkdownFormatter, SemanticModelExporter, ThumbnailGenerator
+        from .formatters.directory_organizer import DirectoryOrganizer
+        
         input_path = Path(input_path)
         
         # Setup output directory - centralized by default
@@ -437,10 +478,11 @@ def process_videos(ctx, input_path, output, format, organize, parallel, classify
                 logger.error(f"Failed to process {video_file}: {e}", exc_info=True)
         
         # Final summary
-        click.echo(f"\n✅ Processing complete!")
-        click.echo(f"   📊 Successfully processed: {processed_count}")
-        click.echo(f"   ❌ Failed: {failed_count}")
-        click.echo(f"   📁 Output directory: {output_dir}")
+        click.echo(_TPL_VIDEOS_SUMMARY.format(
+            processed=processed_count,
+            failed=failed_count,
+            output=output_dir
+        ))
         
         # Show directory structure if organized
         if organize and organizer:
@@ -452,7 +494,7 @@ def process_videos(ctx, input_path, output, format, organize, parallel, classify
         
     except Exception as e:
         logger.error(f"Video processing failed: {e}", exc_info=True)
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -532,7 +574,7 @@ def extract_metadata(ctx, video_path, output, format, include_technical, include
         
         # Add DJI metadata if available
         if result.dji_metadata:
-            metadata['dji_metadata'] = dict(result.dji_metadata)
+            metadata['dji_metadata'] = result.dji_metadata
         
         # Determine output path - use centralized output by default
         if output:
@@ -544,9 +586,8 @@ def extract_metadata(ctx, video_path, output, format, include_technical, include
         
         # Write metadata
         if format == 'json':
-            import json
-            with open(output_path, 'w') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            with open(output_path, 'wb') as f:
+                f.write(_dump_json(metadata))
         else:  # markdown
             md_content = f"""# Video Metadata: {metadata['filename']}
 
@@ -582,7 +623,7 @@ def extract_metadata(ctx, video_path, output, format, include_technical, include
             
             if 'dji_metadata' in metadata:
                 md_content += "## DJI Metadata\n\n"
-                for key, value in metadata['dji_metadata'].items():
+                for key, value in result.dji_metadata.items():
                     md_content += f"- **{key}:** {value}\n"
             
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -606,7 +647,7 @@ def extract_metadata(ctx, video_path, output, format, include_technical, include
         
     except Exception as e:
         logger.error(f"Metadata extraction failed: {e}", exc_info=True)
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -676,7 +717,7 @@ def generate_catalog(ctx, directory, output, format, include_thumbnails, group_b
         
     except Exception as e:
         logger.error(f"Catalog generation failed: {e}", exc_info=True)
-        click.echo(f"❌ Error: {e}", err=True)
+        click.echo(_TPL_ERROR.format(e), err=True)
         sys.exit(1)
 
 
@@ -684,11 +725,9 @@ def _write_report(report: FlightReport, output_path: Path, format: str) -> None:
     """Write report to file in specified format."""
     
     if format == 'json':
-        # Convert report to JSON-serializable dict
-        report_dict = _report_to_dict(report)
-        
-        with open(output_path, 'w') as f:
-            json.dump(report_dict, f, indent=2, default=str)
+        # Serialize straight to UTF-8 bytes
+        with open(output_path, 'wb') as f:
+            f.write(_dump_report(report))
             
     elif format == 'markdown':
         markdown_content = _report_to_markdown(report)
@@ -711,80 +750,144 @@ def _write_report(report: FlightReport, output_path: Path, format: str) -> None:
             ])
             
             # Data
+            fm = report.flight_metrics
+            qs = report.quality_score
+            ms = report.media_summary
+            bm = report.bay_mapping
+            ic = report.inspection_classification
             writer.writerow([
                 report.flight_id,
-                report.bay_mapping.bay_id if report.bay_mapping else '',
-                report.inspection_classification.inspection_type.value,
-                report.quality_score.get_grade(),
-                f"{report.quality_score.overall_score:.3f}",
-                f"{report.flight_metrics.max_altitude:.1f}",
-                f"{report.flight_metrics.total_distance:.3f}",
-                f"{report.flight_metrics.battery_consumed:.1f}",
-                report.media_summary.total_photos,
-                report.media_summary.total_videos,
+                bm.bay_id if bm else '',
+                ic.inspection_type.value,
+                qs.grade,
+                f"{qs.overall_score:.3f}",
+                f"{fm.max_altitude:.1f}",
+                f"{fm.total_distance:.3f}",
+                f"{fm.battery_consumed:.1f}",
+                ms.total_photos,
+                ms.total_videos,
                 len(report.anomalies),
                 f"{report.processing_time.total_seconds():.1f}"
             ])
 
 
+def _replace_non_finite(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, which orjson writes as null."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback serializer for values the stdlib JSON encoder cannot handle."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # NumPy values from parsed telemetry, serialized as numbers like orjson does
+    # (a NumPy value implies NumPy is already imported, so it is looked up rather than imported)
+    np = sys.modules.get('numpy')
+    if np is not None and isinstance(value, (np.generic, np.ndarray)):
+        return _replace_non_finite(value.tolist())
+    return str(value)
+
+
+def _dump_json(data: Any) -> bytes:
+    """
+    Serialize data to indented UTF-8 encoded JSON, using orjson when available.
+    
+    Both encoders write the same bytes: non-finite floats become null, and values
+    orjson rejects, such as integers beyond 64 bits in raw parser output, are
+    written by the stdlib encoder instead.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        _replace_non_finite(data), indent=2, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def _dump_report(report: FlightReport) -> bytes:
+    """Serialize FlightReport to UTF-8 encoded JSON."""
+    return _dump_json(_report_to_dict(report))
+
+
 def _report_to_dict(report: FlightReport) -> Dict[str, Any]:
-    """Convert FlightReport to dictionary for JSON serialization."""
+    """Convert FlightReport to dictionary for JSON serialization.
+    
+    Datetimes are left as-is; _dump_report renders them in ISO 8601 format.
+    """
+    bm = report.bay_mapping
+    fm = report.flight_metrics
+    qs = report.quality_score
+    ic = report.inspection_classification
+    ms = report.media_summary
+    fp = report.flight_path
     return {
         'flight_id': report.flight_id,
-        'timestamp_generated': report.timestamp_generated.isoformat(),
+        'timestamp_generated': report.timestamp_generated,
         'processing_time_seconds': report.processing_time.total_seconds() if report.processing_time else 0,
         
         'bay_mapping': {
-            'bay_id': report.bay_mapping.bay_id,
-            'bay_name': report.bay_mapping.bay_name,
-            'confidence_score': report.bay_mapping.confidence_score,
-            'coverage_percentage': report.bay_mapping.coverage_percentage
-        } if report.bay_mapping else None,
+            'bay_id': bm.bay_id,
+            'bay_name': bm.bay_name,
+            'confidence_score': bm.confidence_score,
+            'coverage_percentage': bm.coverage_percentage
+        } if bm else None,
         
         'flight_metrics': {
-            'max_altitude_ft': report.flight_metrics.max_altitude,
-            'avg_altitude_ft': report.flight_metrics.avg_altitude,
-            'max_speed_mph': report.flight_metrics.max_speed,
-            'avg_speed_mph': report.flight_metrics.avg_speed,
-            'total_distance_miles': report.flight_metrics.total_distance,
-            'battery_start_pct': report.flight_metrics.battery_start,
-            'battery_end_pct': report.flight_metrics.battery_end,
-            'battery_consumed_pct': report.flight_metrics.battery_consumed,
-            'gps_quality_avg': report.flight_metrics.gps_quality_avg
+            'max_altitude_ft': fm.max_altitude,
+            'avg_altitude_ft': fm.avg_altitude,
+            'max_speed_mph': fm.max_speed,
+            'avg_speed_mph': fm.avg_speed,
+            'total_distance_miles': fm.total_distance,
+            'battery_start_pct': fm.battery_start,
+            'battery_end_pct': fm.battery_end,
+            'battery_consumed_pct': fm.battery_consumed,
+            'gps_quality_avg': fm.gps_quality_avg
         },
         
         'quality_score': {
-            'overall_score': report.quality_score.overall_score,
-            'grade': report.quality_score.get_grade(),
-            'gps_quality': report.quality_score.gps_quality,
-            'battery_health': report.quality_score.battery_health,
-            'flight_stability': report.quality_score.flight_stability,
-            'coverage_quality': report.quality_score.coverage_quality,
-            'equipment_performance': report.quality_score.equipment_performance
+            'overall_score': qs.overall_score,
+            'grade': qs.grade,
+            'gps_quality': qs.gps_quality,
+            'battery_health': qs.battery_health,
+            'flight_stability': qs.flight_stability,
+            'coverage_quality': qs.coverage_quality,
+            'equipment_performance': qs.equipment_performance
         },
         
         'inspection_classification': {
-            'inspection_type': report.inspection_classification.inspection_type.value,
-            'confidence': report.inspection_classification.confidence
+            'inspection_type': ic.inspection_type.value,
+            'confidence': ic.confidence
         },
         
         'media_summary': {
-            'total_photos': report.media_summary.total_photos,
-            'total_videos': report.media_summary.total_videos,
-            'video_duration_minutes': report.media_summary.total_video_duration.total_seconds() / 60
+            'total_photos': ms.total_photos,
+            'total_videos': ms.total_videos,
+            'video_duration_minutes': ms.total_video_duration.total_seconds() / 60
         },
         
         'flight_path': {
-            'total_distance_miles': report.flight_path.total_distance,
-            'coordinate_count': len(report.flight_path.coordinates),
-            'is_circular': report.flight_path.is_circular,
-            'is_linear': report.flight_path.is_linear,
-            'circuit_completion': report.flight_path.circuit_completion
+            'total_distance_miles': fp.total_distance,
+            'coordinate_count': len(fp.coordinates),
+            'is_circular': fp.is_circular,
+            'is_linear': fp.is_linear,
+            'circuit_completion': fp.circuit_completion
         },
         
         'anomalies': [
             {
-                'timestamp': anomaly.timestamp.isoformat(),
+                'timestamp': anomaly.timestamp,
                 'type': anomaly.anomaly_type,
                 'severity': anomaly.severity,
                 'description': anomaly.description
@@ -799,55 +902,60 @@ def _report_to_dict(report: FlightReport) -> Dict[str, Any]:
 
 def _report_to_markdown(report: FlightReport) -> str:
     """Convert FlightReport to Markdown format."""
-    md = f"""# Flight Report: {report.flight_id}
+    bm = report.bay_mapping
+    fm = report.flight_metrics
+    qs = report.quality_score
+    ms = report.media_summary
+    grade = qs.grade
+    parts = [f"""# Flight Report: {report.flight_id}
 
 **Generated:** {report.timestamp_generated.strftime('%Y-%m-%d %H:%M:%S')}  
 **Processing Time:** {report.processing_time.total_seconds():.1f}s
 
 ## Summary
 
-- **Bay:** {report.bay_mapping.bay_id if report.bay_mapping else 'Unknown'}
+- **Bay:** {bm.bay_id if bm else 'Unknown'}
 - **Inspection Type:** {report.inspection_classification.inspection_type.value}
-- **Quality Grade:** {report.quality_score.get_grade()} ({report.quality_score.overall_score:.2f})
+- **Quality Grade:** {grade} ({qs.overall_score:.2f})
 
 ## Flight Metrics
 
 | Metric | Value |
 |--------|-------|
-| Max Altitude | {report.flight_metrics.max_altitude:.1f} ft |
-| Average Altitude | {report.flight_metrics.avg_altitude:.1f} ft |
-| Max Speed | {report.flight_metrics.max_speed:.1f} mph |
-| Total Distance | {report.flight_metrics.total_distance:.2f} miles |
-| Battery Consumed | {report.flight_metrics.battery_consumed:.1f}% |
-| GPS Quality | {report.flight_metrics.gps_quality_avg:.1f} satellites |
+| Max Altitude | {fm.max_altitude:.1f} ft |
+| Average Altitude | {fm.avg_altitude:.1f} ft |
+| Max Speed | {fm.max_speed:.1f} mph |
+| Total Distance | {fm.total_distance:.2f} miles |
+| Battery Consumed | {fm.battery_consumed:.1f}% |
+| GPS Quality | {fm.gps_quality_avg:.1f} satellites |
 
 ## Media Summary
 
-- **Photos:** {report.media_summary.total_photos}
-- **Videos:** {report.media_summary.total_videos}
-- **Video Duration:** {report.media_summary.total_video_duration.total_seconds() / 60:.1f} minutes
+- **Photos:** {ms.total_photos}
+- **Videos:** {ms.total_videos}
+- **Video Duration:** {ms.total_video_duration.total_seconds() / 60:.1f} minutes
 
 ## Quality Assessment
 
 | Component | Score | Rating |
 |-----------|-------|--------|
-| Overall | {report.quality_score.overall_score:.2f} | {report.quality_score.get_grade()} |
-| GPS Quality | {report.quality_score.gps_quality:.2f} | {'✓' if report.quality_score.gps_quality > 0.8 else '⚠️'} |
-| Battery Health | {report.quality_score.battery_health:.2f} | {'✓' if report.quality_score.battery_health > 0.8 else '⚠️'} |
-| Flight Stability | {report.quality_score.flight_stability:.2f} | {'✓' if report.quality_score.flight_stability > 0.8 else '⚠️'} |
-"""
+| Overall | {qs.overall_score:.2f} | {grade} |
+| GPS Quality | {qs.gps_quality:.2f} | {_QUALITY_BADGES[int(qs.gps_quality > 0.8)]} |
+| Battery Health | {qs.battery_health:.2f} | {_QUALITY_BADGES[int(qs.battery_health > 0.8)]} |
+| Flight Stability | {qs.flight_stability:.2f} | {_QUALITY_BADGES[int(qs.flight_stability > 0.8)]} |
+"""]
 
     if report.anomalies:
-        md += f"\n## Anomalies ({len(report.anomalies)})\n\n"
+        parts.append(f"\n## Anomalies ({len(report.anomalies)})\n\n")
         for anomaly in report.anomalies:
-            md += f"- **{anomaly.severity.upper()}:** {anomaly.description}\n"
+            parts.append(f"- **{anomaly.severity.upper()}:** {anomaly.description}\n")
     
     if report.human_verification_needed:
-        md += f"\n## Human Verification Required\n\n"
+        parts.append("\n## Human Verification Required\n\n")
         for item in report.human_verification_needed:
-            md += f"- {item.replace('_', ' ').title()}\n"
+            parts.append(f"- {item.replace('_', ' ').title()}\n")
     
-    return md
+    return ''.join(parts)
 
 
 def _generate_batch_summary(reports: List[FlightReport]) -> Dict[str, Any]:
@@ -857,183 +965,263 @@ def _generate_batch_summary(reports: List[FlightReport]) -> Dict[str, Any]:
     
     total_flights = len(reports)
     
-    # Quality distribution
-    grades = [r.quality_score.get_grade() for r in reports]
-    grade_distribution = {grade: grades.count(grade) for grade in set(grades)}
+    grade_counter = Counter()
+    bay_counter = Counter()
+    altitude_total = distance_total = battery_total = 0.0
+    processing_total = 0.0
+    processing_count = 0
+    anomaly_total = 0
+    flights_with_anomalies = 0
+    anomaly_types: Set[str] = set()
     
-    # Average metrics
-    avg_altitude = sum(r.flight_metrics.avg_altitude for r in reports) / total_flights
-    avg_distance = sum(r.flight_metrics.total_distance for r in reports) / total_flights
-    avg_battery = sum(r.flight_metrics.battery_consumed for r in reports) / total_flights
+    # Single pass over the batch accumulating every aggregate
+    for r in reports:
+        grade_counter[r.quality_score.grade] += 1
+        if r.bay_mapping:
+            bay_counter[r.bay_mapping.bay_id] += 1
+        
+        altitude_total += r.flight_metrics.avg_altitude
+        distance_total += r.flight_metrics.total_distance
+        battery_total += r.flight_metrics.battery_consumed
+        
+        if r.processing_time:
+            processing_total += r.processing_time.total_seconds()
+            processing_count += 1
+        
+        if r.anomalies:
+            flights_with_anomalies += 1
+            anomaly_total += len(r.anomalies)
+            for a in r.anomalies:
+                anomaly_types.add(a.anomaly_type)
     
-    # Bay distribution
-    bays = [r.bay_mapping.bay_id for r in reports if r.bay_mapping]
-    bay_distribution = {bay: bays.count(bay) for bay in set(bays)} if bays else {}
+    # Average metrics
+    avg_altitude = altitude_total / total_flights
+    avg_distance = distance_total / total_flights
+    avg_battery = battery_total / total_flights
     
     # Processing performance
-    avg_processing_time = sum(
-        r.processing_time.total_seconds() for r in reports if r.processing_time
-    ) / max(len([r for r in reports if r.processing_time]), 1)
+    avg_processing_time = processing_total / max(processing_count, 1)
     
     return {
         'batch_summary': {
             'total_flights': total_flights,
-            'timestamp_generated': datetime.now().isoformat(),
+            'timestamp_generated': datetime.now(),
             'processing_performance': {
                 'avg_processing_time_seconds': avg_processing_time,
-                'total_processing_time_seconds': sum(
-                    r.processing_time.total_seconds() for r in reports if r.processing_time
-                )
+                'total_processing_time_seconds': processing_total
             }
         },
-        'quality_distribution': grade_distribution,
-        'bay_distribution': bay_distribution,
+        'quality_distribution': dict(grade_counter),
+        'bay_distribution': dict(bay_counter),
         'average_metrics': {
             'altitude_ft': round(avg_altitude, 1),
             'distance_miles': round(avg_distance, 2), 
             'battery_consumed_pct': round(avg_battery, 1)
         },
         'anomaly_summary': {
-            'total_anomalies': sum(len(r.anomalies) for r in reports),
-            'flights_with_anomalies': len([r for r in reports if r.anomalies]),
-            'anomaly_types': list(set(
-                a.anomaly_type for r in reports for a in r.anomalies
-            ))
+            'total_anomalies': anomaly_total,
+            'flights_with_anomalies': flights_with_anomalies,
+            'anomaly_types': list(anomaly_types)
         }
     }
 
 
-def _generate_html_catalog(metadata_files: List[Path], base_directory: Path, 
-                          include_thumbnails: bool, group_by: str) -> str:
-    """Generate HTML catalog content."""
-    html_content = f"""<!DOCTYPE html>
+# Catalog templates, compiled once at import
+_CATALOG_HEADINGS = {
+    'mission': '📋 Videos by Mission Type',
+    'date': '📅 Videos by Date',
+}
+_CATALOG_DEFAULT_HEADING = '🎥 All Videos'
+
+_HTML_CATALOG_TMPL = jinja2.Template("""<!DOCTYPE html>
 <html>
 <head>
     <title>Drone Video Catalog</title>
     <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ text-align: center; margin-bottom: 30px; }}
-        .video-group {{ margin-bottom: 40px; }}
-        .video-item {{ 
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { text-align: center; margin-bottom: 30px; }
+        .video-group { margin-bottom: 40px; }
+        .video-item { 
             border: 1px solid #ddd; 
             border-radius: 8px; 
             margin: 20px 0; 
             padding: 15px; 
             background: #f9f9f9;
-        }}
-        .thumbnail {{ float: left; margin-right: 15px; max-width: 200px; }}
-        .metadata {{ overflow: auto; }}
-        .filename {{ font-weight: bold; font-size: 1.2em; color: #333; }}
-        .details {{ margin-top: 10px; }}
-        .mission-badge {{ 
+        }
+        .thumbnail { float: left; margin-right: 15px; max-width: 200px; }
+        .metadata { overflow: auto; }
+        .filename { font-weight: bold; font-size: 1.2em; color: #333; }
+        .details { margin-top: 10px; }
+        .mission-badge { 
             display: inline-block; 
             padding: 4px 8px; 
             border-radius: 4px; 
             background: #007bff; 
             color: white; 
             font-size: 0.9em;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>🚁 Drone Video Catalog</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Total Videos: {len(metadata_files)}</p>
+        <p>Generated: {{ generated }}</p>
+        <p>Total Videos: {{ total }}</p>
     </div>
-"""
-    
-    # Group files if requested
-    if group_by == 'mission':
-        html_content += "<div class='video-group'><h2>📋 Videos by Mission Type</h2>"
-    elif group_by == 'date':
-        html_content += "<div class='video-group'><h2>📅 Videos by Date</h2>"
-    else:
-        html_content += "<div class='video-group'><h2>🎥 All Videos</h2>"
-    
-    # Add video entries
-    for metadata_file in metadata_files:
-        try:
-            # Extract basic info from filename
-            video_name = metadata_file.stem.replace('_metadata', '').replace('.MP4', '.MP4')
-            
-            # Look for thumbnail
-            thumbnail_path = None
-            if include_thumbnails:
-                thumbnail_candidates = [
-                    metadata_file.parent / f"{video_name}_thumbnail.jpg",
-                    metadata_file.parent / "thumbnails" / f"{video_name}_thumbnail.jpg",
-                ]
-                for candidate in thumbnail_candidates:
-                    if candidate.exists():
-                        thumbnail_path = candidate.relative_to(base_directory)
-                        break
-            
-            html_content += f"""
+<div class='video-group'><h2>{{ heading }}</h2>
+{%- for entry in files %}
             <div class="video-item">
-                <div class="filename">{video_name}</div>
-                {f'<img class="thumbnail" src="{thumbnail_path}" alt="Thumbnail">' if thumbnail_path else ''}
+                <div class="filename">{{ entry.video_name }}</div>
+                {% if entry.thumbnail %}<img class="thumbnail" src="{{ entry.thumbnail }}" alt="Thumbnail">{% endif %}
                 <div class="metadata">
                     <div class="details">
                         <span class="mission-badge">Video File</span>
-                        <p>Metadata: {metadata_file.name}</p>
+                        <p>Metadata: {{ entry.metadata_name }}</p>
                     </div>
                 </div>
                 <div style="clear: both;"></div>
             </div>
-            """
-        except Exception as e:
-            logger.warning(f"Failed to process metadata file {metadata_file}: {e}")
-    
-    html_content += "</div></body></html>"
-    return html_content
+{%- endfor %}
+</div></body></html>""", autoescape=True)
 
+_MARKDOWN_CATALOG_TMPL = jinja2.Template("""# 🚁 Drone Video Catalog
 
-def _generate_markdown_catalog(metadata_files: List[Path], base_directory: Path,
-                              include_thumbnails: bool, group_by: str) -> str:
-    """Generate Markdown catalog content."""
-    md_content = f"""# 🚁 Drone Video Catalog
+**Generated:** {{ generated }}  
+**Total Videos:** {{ total }}
+
+---
+
+## {{ heading }}
+
+{% for entry in files -%}
+### {{ entry.index }}. {{ entry.video_name }}
+
+{% if entry.thumbnail %}![Thumbnail]({{ entry.thumbnail }})
 
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
-**Total Videos:** {len(metadata_files)}
+{% endif %}**Metadata File:** `{{ entry.metadata_name }}`
 
 ---
 
-"""
+{% endfor %}""", keep_trailing_newline=True)
+
+
+def _scan_directory(directory: str) -> Set[str]:
+    """Return the entry names of a directory, or an empty set if it cannot be read."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def _scan_catalog_directory(directory: str) -> Dict[str, Set[str]]:
+    """Scan a metadata directory together with its thumbnails subdirectory, if any."""
+    names = _scan_directory(directory)
+    listings = {directory: names}
+    if "thumbnails" in names:
+        thumbnails_dir = os.path.join(directory, "thumbnails")
+        listings[thumbnails_dir] = _scan_directory(thumbnails_dir)
+    return listings
+
+
+def _list_directory(directory: str, listings: Dict[str, Set[str]]) -> Set[str]:
+    """Return the entry names of a directory, scanning each directory only once."""
+    names = listings.get(directory)
+    if names is None:
+        names = listings[directory] = _scan_directory(directory)
+    return names
+
+
+def _find_catalog_thumbnail(metadata_file: Path, video_name: str, base_directory: Path,
+                            listings: Dict[str, Set[str]]) -> Optional[Path]:
+    """Locate a video's thumbnail next to its metadata file, relative to the catalog root."""
+    # Plain string paths here; a Path is only built for a thumbnail that exists
+    thumbnail_name = video_name + '_thumbnail.jpg'
+    parent = str(metadata_file.parent)
+    parent_names = _list_directory(parent, listings)
+    
+    if thumbnail_name in parent_names:
+        return Path(os.path.join(parent, thumbnail_name)).relative_to(base_directory)
+    
+    if "thumbnails" in parent_names:
+        thumbnails_dir = os.path.join(parent, "thumbnails")
+        if thumbnail_name in _list_directory(thumbnails_dir, listings):
+            return Path(os.path.join(thumbnails_dir, thumbnail_name)).relative_to(base_directory)
     
-    if group_by == 'mission':
-        md_content += "## 📋 Videos by Mission Type\n\n"
-    elif group_by == 'date':
-        md_content += "## 📅 Videos by Date\n\n"
-    else:
-        md_content += "## 🎥 All Videos\n\n"
+    return None
+
+
+def _collect_catalog_entries(metadata_files: List[Path], base_directory: Path,
+                             include_thumbnails: bool) -> List[Dict[str, Any]]:
+    """Gather the per-video fields rendered by the catalog templates."""
+    entries = []
+    listings: Dict[str, Set[str]] = {}
+    
+    if include_thumbnails:
+        # Directory scans are I/O-bound, so run them concurrently up front
+        directories = list(dict.fromkeys(str(f.parent) for f in metadata_files))
+        with ThreadPoolExecutor() as executor:
+            for scanned in executor.map(_scan_catalog_directory, directories):
+                listings.update(scanned)
     
-    # Add video entries
     for i, metadata_file in enumerate(metadata_files, 1):
         try:
-            video_name = metadata_file.stem.replace('_metadata', '').replace('.MP4', '.MP4')
-            
-            md_content += f"### {i}. {video_name}\n\n"
+            # Extract basic info from filename
+            stem = metadata_file.stem
+            video_name = stem[:-len('_metadata')] if stem.endswith('_metadata') else stem
             
             # Look for thumbnail
+            thumbnail_path = None
             if include_thumbnails:
-                thumbnail_candidates = [
-                    metadata_file.parent / f"{video_name}_thumbnail.jpg",
-                    metadata_file.parent / "thumbnails" / f"{video_name}_thumbnail.jpg",
-                ]
-                for candidate in thumbnail_candidates:
-                    if candidate.exists():
-                        thumbnail_rel = candidate.relative_to(base_directory)
-                        md_content += f"![Thumbnail]({thumbnail_rel})\n\n"
-                        break
-            
-            md_content += f"**Metadata File:** `{metadata_file.name}`\n\n"
-            md_content += "---\n\n"
+                thumbnail_path = _find_catalog_thumbnail(
+                    metadata_file, video_name, base_directory, listings
+                )
             
+            entries.append({
+                'index': i,
+                'video_name': video_name,
+                'thumbnail': thumbnail_path,
+                'metadata_name': metadata_file.name,
+            })
         except Exception as e:
             logger.warning(f"Failed to process metadata file {metadata_file}: {e}")
-    
-    return md_content
+    return entries
+
+
+def _catalog_header_context(metadata_files: List[Path], group_by: str) -> Dict[str, Any]:
+    """Values for the placeholders in the frozen catalog header templates."""
+    return {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total': len(metadata_files),
+        'heading': _CATALOG_HEADINGS.get(group_by, _CATALOG_DEFAULT_HEADING),
+    }
+
+
+def _generate_html_catalog(metadata_files: List[Path], base_directory: Path, 
+                          include_thumbnails: bool, group_by: str) -> str:
+    """Generate HTML catalog content."""
+    entries = _collect_catalog_entries(metadata_files, base_directory, include_thumbnails)
+    return _HTML_CATALOG_TMPL.render(
+        files=entries, **_catalog_header_context(metadata_files, group_by)
+    )
+
+
+def _generate_markdown_catalog(metadata_files: List[Path], base_directory: Path,
+                              include_thumbnails: bool, group_by: str) -> str:
+    """Generate Markdown catalog content."""
+    entries = _collect_catalog_entries(metadata_files, base_directory, include_thumbnails)
+    return _MARKDOWN_CATALOG_TMPL.render(
+        files=entries, **_catalog_header_context(metadata_files, group_by)
+    )
+
+
+def _first_metadata_value(key: str, sources: Tuple[Dict[str, Any], ...]) -> Any:
+    """Return the first non-None value for key across metadata dicts, in priority order."""
+    for source in sources:
+        value = source.get(key)
+        if value is not None:
+            return value
+    return None
 
 
 def _create_analysis_result_from_parse(parse_result, video_file):
@@ -1041,10 +1229,12 @@ def _create_analysis_result_from_parse(parse_result, video_file):
     from .models import VideoMetadata, VideoAnalysisResult, TechnicalSpecs, GPSData
     from datetime import datetime
     
+    video_path = Path(video_file)
+    
     # Create video metadata
     file_info = parse_result.file_info
     video_metadata = VideoMetadata(
-        filename=Path(video_file).name,
+        filename=video_path.name,
         filepath=str(video_file),
         filesize_bytes=int(file_info.get('size_mb', 0) * 1024 * 1024),
         filesize_mb=file_info.get('size_mb', 0),
@@ -1052,20 +1242,20 @@ def _create_analysis_result_from_parse(parse_result, video_file):
         creation_time=file_info.get('created_at')
     )
     
-    # Create technical specs from combined metadata
-    all_metadata = {
-        **parse_result.ffmpeg_metadata,
-        **parse_result.hachoir_metadata,
-        **parse_result.mediainfo_metadata
-    }
+    # Create technical specs from the metadata sources, later extractors taking precedence
+    sources = (
+        parse_result.mediainfo_metadata,
+        parse_result.hachoir_metadata,
+        parse_result.ffmpeg_metadata
+    )
     
     technical_specs = TechnicalSpecs(
-        width=all_metadata.get('width'),
-        height=all_metadata.get('height'),
-        framerate=all_metadata.get('frame_rate') or all_metadata.get('fps'),
-        bitrate_video=all_metadata.get('bit_rate') or all_metadata.get('bitrate'),
-        video_codec=all_metadata.get('codec_name') or all_metadata.get('codec'),
-        container_format=Path(video_file).suffix.lower().lstrip('.')
+        width=_first_metadata_value('width', sources),
+        height=_first_metadata_value('height', sources),
+        framerate=_first_metadata_value('frame_rate', sources) or _first_metadata_value('fps', sources),
+        bitrate_video=_first_metadata_value('bit_rate', sources) or _first_metadata_value('bitrate', sources),
+        video_codec=_first_metadata_value('codec_name', sources) or _first_metadata_value('codec', sources),
+        container_format=video_path.suffix.lower().lstrip('.')
     )
     
     # Create GPS data if available
@@ -15,11 +15,39 @@ Formatters follow a consistent interface pattern for generating:
 All formatters inherit from BaseFormatter for consistent behavior.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base_formatter import BaseFormatter, FormatterError, FormatterConfig
-from .markdown_formatter import MarkdownFormatter
-from .thumbnail_generator import ThumbnailGenerator
-from .semantic_model_exporter import SemanticModelExporter
-from .dataset_index_generator import DatasetIndexGenerator
+
+if TYPE_CHECKING:
+    from .markdown_formatter import MarkdownFormatter
+    from .thumbnail_generator import ThumbnailGenerator
+    from .semantic_model_exporter import SemanticModelExporter
+    from .dataset_index_generator import DatasetIndexGenerator
+
+# Concrete formatters are imported on first access (PEP 562) so that importing
+# one formatter does not pull in the dependencies of all the others.
+_LAZY_IMPORTS = {
+    "MarkdownFormatter": ".markdown_formatter",
+    "ThumbnailGenerator": ".thumbnail_generator",
+    "SemanticModelExporter": ".semantic_model_exporter",
+    "DatasetIndexGenerator": ".dataset_index_generator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "BaseFormatter",
@@ -8,10 +8,12 @@ from BaseFormatter to ensure consistent interface and behavior.
 """
 
 import logging
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from datetime import datetime
 
 from ..models import VideoAnalysisResult, VideoProcessingBatch
@@ -23,15 +25,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Flags for writing output files through a raw descriptor (O_BINARY only exists on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Buffers handed to a single os.writev call (the Linux and macOS IOV_MAX)
+_IOV_MAX = 1024
+
 
 class FormatterError(Exception):
     """Exception raised for formatter-related errors."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatterConfig:
-    """Configuration settings for formatters."""
+    """Configuration settings for formatters.
+    
+    Slotted, so formatter-specific options must be declared here rather than
+    attached to an instance ad hoc.
+    """
     output_directory: str
     template_directory: Optional[str] = None
     overwrite_existing: bool = False
@@ -45,6 +57,19 @@ class FormatterConfig:
     
     # Organization support
     organizer: Optional['DirectoryOrganizer'] = None
+    move_files: bool = True  # Move vs copy files
+    preserve_originals: bool = False
+    create_symlinks: bool = False
+    summary_max_files: Optional[int] = 500  # Files listed in the organization summary (None: all)
+    
+    # Thumbnail generation
+    thumbnail_timestamp: float = 3.0  # Seconds into the video
+    thumbnail_width: int = 640
+    thumbnail_quality: int = 2  # FFmpeg JPEG quality 1-31, lower is better
+    fallback_enabled: bool = True
+    
+    # Threads for per-video I/O in format_batch (None: based on CPU count)
+    io_parallelism: Optional[int] = None
     
     # Custom formatter-specific settings
     custom_settings: Dict[str, Any] = field(default_factory=dict)
@@ -68,6 +93,7 @@ class BaseFormatter(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        self._output_dir = Path(config.output_directory)
         
         # Ensure output directory exists
         if self.config.create_directories:
@@ -75,7 +101,7 @@ class BaseFormatter(ABC):
     
     def _ensure_output_directory(self) -> None:
         """Ensure the output directory exists."""
-        output_path = Path(self.config.output_directory)
+        output_path = self._output_dir
         if not output_path.exists():
             try:
                 output_path.mkdir(parents=True, exist_ok=True)
@@ -99,7 +125,44 @@ class BaseFormatter(ABC):
         if self.config.organizer and result and file_extension:
             return self.config.organizer.get_organized_output_path(result, file_extension, filename)
         else:
-            return Path(self.config.output_directory) / filename
+            return self._output_dir / filename
+    
+    def _write_text_file(self, file_path: Path, content: str) -> None:
+        """
+        Write a complete text document to a file as UTF-8.
+        
+        The content is encoded once and written straight to a raw file
+        descriptor, skipping the text and buffered I/O layers of open().
+        """
+        self._write_byte_chunks(file_path, [content.encode('utf-8')])
+    
+    def _write_byte_chunks(self, file_path: Path, chunks: Iterable[bytes]) -> None:
+        """
+        Write a stream of encoded chunks to a file.
+        
+        Chunks are consumed in groups of at most IOV_MAX and each group is
+        written with scatter-gather os.writev where available (os.write on
+        Windows), so a generator is never held in memory all at once.
+        """
+        writev = getattr(os, 'writev', None)
+        chunks = iter(chunks)
+        fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+        try:
+            while group := list(islice(chunks, _IOV_MAX)):
+                written = writev(fd, group) if writev is not None else 0
+                
+                # Finish short writes with plain os.write
+                if written < sum(map(len, group)):
+                    rest = memoryview(b"".join(group))[written:]
+                    while rest:
+                        rest = rest[os.write(fd, rest):]
+        finally:
+            os.close(fd)
+    
+    def _get_io_workers(self, task_count: int) -> int:
+        """Get the number of threads to use for I/O-bound work over task_count items."""
+        workers = self.config.io_parallelism or min(32, (os.cpu_count() or 1) * 4)
+        return max(1, min(workers, task_count))
     
     def _log_processing_start(self, operation: str, target: str) -> None:
         """Log the start of a processing operation."""
@@ -188,6 +251,8 @@ class BaseFormatter(ABC):
 class FormatterRegistry:
     """Registry for managing available formatters."""
     
+    __slots__ = ('_formatters',)
+    
     def __init__(self):
         self._formatters: Dict[str, type] = {}
     
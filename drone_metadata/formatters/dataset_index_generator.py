@@ -7,12 +7,63 @@ master dataset index files and documentation similar to the
 DATASET_INDEX.md file in Pilot04_Field_Test_April_25.
 """
 
+import io
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from .base_formatter import BaseFormatter, FormatterError
-from ..models import VideoAnalysisResult, VideoProcessingBatch, MissionType
+from ..models import VideoAnalysisResult, VideoProcessingBatch
+
+# Mission label for results without mission classification
+UNKNOWN_MISSION = "unknown"
+
+# Timestamp format used throughout the generated documentation
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Per-video row templates, filled from the derived result fields
+INVENTORY_FMT = "- `{filename}` - {duration_fmt}, {size_mb_str}, {mission_val}, {gps_label}\n"
+REPORT_RECORD_FMT = "{0:2d}. {filename}\n    Status: {1}\n    Size: {size_mb:.2f} MB\n    Duration: {duration_fmt}\n"
+
+# Encoded bytes accumulated before each write to disk
+WRITE_CHUNK_SIZE = 1 << 16
+
+# Suffix of the temporary file a document is written to before being moved into place
+TEMP_SUFFIX = ".tmp"
+
+
+@contextmanager
+def _open_utf8_writer(path: Path) -> Iterator[Callable[[str], None]]:
+    """
+    Open a file for binary writing and yield a function that appends text to it.
+    
+    Text is encoded to UTF-8 into a local buffer that is flushed to the file
+    in chunks of WRITE_CHUNK_SIZE bytes, so the file is written without a
+    text-mode encoder on every call. The text goes to a temporary sibling that
+    is moved into place once complete, so a failed write never leaves a
+    truncated document that a later run would keep as an existing output.
+    """
+    buf = bytearray()
+    tmp_path = path.with_name(path.name + TEMP_SUFFIX)
+    try:
+        with open(tmp_path, 'wb') as f:
+            def write(text: str) -> None:
+                buf.extend(text.encode('utf-8'))
+                if len(buf) >= WRITE_CHUNK_SIZE:
+                    f.write(buf)
+                    buf.clear()
+            
+            yield write
+            f.write(buf)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 class DatasetIndexGenerator(BaseFormatter):
@@ -66,24 +117,42 @@ class DatasetIndexGenerator(BaseFormatter):
         
         self._log_processing_start("dataset index generation", f"batch of {len(batch.video_results)} videos")
         
+        # Nothing to regenerate when every output exists and overwrite is disabled
+        existing_paths = self._get_existing_outputs(batch)
+        if existing_paths is not None:
+            return existing_paths
+        
         try:
             output_paths = []
             
+            # One generation timestamp for every file of the batch
+            generated_ts = datetime.now().strftime(TIMESTAMP_FORMAT)
+            
+            # Per-result fields shared by every generated file
+            derived = self._derive_result_fields(batch.video_results)
+            
+            # Single pass over the results for statistics and mission grouping
+            stats, mission_groups, mission_totals = self._calculate_dataset_statistics(
+                batch.video_results, derived
+            )
+            
             # Generate main dataset index
-            index_path = self._generate_dataset_index(batch)
+            index_path = self._generate_dataset_index(batch, stats, derived, generated_ts)
             if index_path:
                 output_paths.append(index_path)
             
             # Generate mission-specific README files
-            mission_readmes = self._generate_mission_readmes(batch)
+            mission_readmes = self._generate_mission_readmes(
+                batch, mission_groups, mission_totals, derived, generated_ts
+            )
             output_paths.extend(mission_readmes)
             
             # Generate processing report
-            report_path = self._generate_processing_report(batch)
+            report_path = self._generate_processing_report(batch, derived, generated_ts)
             if report_path:
                 output_paths.append(report_path)
             
-            self._log_processing_complete("dataset index generation", "batch", Path(self.config.output_directory))
+            self._log_processing_complete("dataset index generation", "batch", self._output_dir)
             return output_paths
             
         except Exception as e:
@@ -91,12 +160,44 @@ class DatasetIndexGenerator(BaseFormatter):
             self._log_processing_error("dataset index generation", "batch", error_msg)
             raise FormatterError(error_msg)
     
-    def _generate_dataset_index(self, batch: VideoProcessingBatch) -> Path:
+    def _get_existing_outputs(self, batch: VideoProcessingBatch) -> Optional[List[Path]]:
+        """
+        Return the batch's output paths if all of them already exist and may not be overwritten.
+        
+        Args:
+            batch: Batch of video analysis results
+            
+        Returns:
+            Existing output paths in generation order, or None if anything needs generating
+        """
+        if self.config.overwrite_existing:
+            return None
+        
+        missions = dict.fromkeys(
+            result.mission_data.mission_type.value if result.mission_data else UNKNOWN_MISSION
+            for result in batch.video_results
+        )
+        output_paths = [self._get_output_path("DATASET_INDEX.md")]
+        output_paths.extend(self._get_output_path(f"{mission}_README.md") for mission in missions)
+        output_paths.append(self._get_output_path("PROCESSING_REPORT.txt"))
+        
+        if not all(path.exists() for path in output_paths):
+            return None
+        
+        for path in output_paths:
+            self.logger.warning(f"File exists and overwrite disabled: {path}")
+        return output_paths
+    
+    def _generate_dataset_index(self, batch: VideoProcessingBatch, stats: Dict[str, Any],
+                                derived: List[Dict[str, Any]], generated_ts: str) -> Path:
         """
         Generate the main DATASET_INDEX.md file.
         
         Args:
             batch: Batch of video analysis results
+            stats: Dataset statistics from _calculate_dataset_statistics
+            derived: Per-result fields from _derive_result_fields
+            generated_ts: Formatted generation timestamp of the batch
             
         Returns:
             Path to generated DATASET_INDEX.md file
@@ -107,221 +208,258 @@ class DatasetIndexGenerator(BaseFormatter):
         if self._check_file_exists(index_path):
             return index_path
         
-        # Calculate statistics
-        stats = self._calculate_dataset_statistics(batch.video_results)
+        # Write markdown content straight to the file
+        with _open_utf8_writer(index_path) as w:
+            # Header
+            w("# Drone Video Dataset Index\n")
+            w("\n")
+            w(f"**Generated**: {generated_ts}\n")
+            w(f"**Total Videos**: {len(batch.video_results)}\n")
+            w(f"**Processing Success Rate**: {batch.get_success_rate():.1f}%\n")
+            w("\n")
+            
+            # Dataset Overview
+            w("## Dataset Overview\n")
+            w("\n")
+            w("This dataset contains drone inspection videos with extracted metadata,\n")
+            w("GPS coordinates, technical specifications, and mission classifications.\n")
+            w("\n")
+            
+            # Statistics Summary
+            w("## Statistics Summary\n")
+            w("\n")
+            w(f"- **Total Duration**: {stats['total_duration']}\n")
+            w(f"- **Total File Size**: {stats['total_size_mb']:.2f} MB\n")
+            w(f"- **Average File Size**: {stats['avg_size_mb']:.2f} MB\n")
+            w(f"- **Videos with GPS**: {stats['videos_with_gps']} ({stats['gps_percentage']:.1f}%)\n")
+            w(f"- **Unique Resolutions**: {len(stats['resolutions'])}\n")
+            w("\n")
+            
+            # Mission Breakdown
+            if stats['missions']:
+                w("## Mission Breakdown\n")
+                w("\n")
+                pct_per_video = stats['pct_per_video']
+                for mission_type, count in stats['missions'].items():
+                    w(f"- **{mission_type.title()}**: {count} videos ({count * pct_per_video:.1f}%)\n")
+                w("\n")
+            
+            # Technical Specifications (only the sections that have data)
+            resolutions = stats['resolutions']
+            codecs = stats['codecs']
+            if resolutions or codecs:
+                w("## Technical Specifications\n\n")
+                if resolutions:
+                    w("### Resolutions\n"
+                      + "".join(f"- **{resolution}**: {count} videos\n" for resolution, count in resolutions.items())
+                      + "\n")
+                if codecs:
+                    w("### Video Codecs\n"
+                      + "".join(f"- **{codec}**: {count} videos\n" for codec, count in codecs.items())
+                      + "\n")
+            
+            # File Inventory
+            w("## File Inventory\n")
+            w("\n")
+            w("### Video Files\n")
+            w("\n")
+            
+            # Stream one line per video rather than holding the inventory in memory
+            fmt = INVENTORY_FMT.format_map
+            for d in derived:
+                w(fmt(d))
+            
+            w("\n")
+            
+            # Processing Information
+            w("## Processing Information\n")
+            w("\n")
+            w(f"- **Batch ID**: {batch.batch_id}\n")
+            w(f"- **Processing Start**: {batch.processing_start.strftime(TIMESTAMP_FORMAT)}\n")
+            
+            if batch.processing_end:
+                duration = batch.get_processing_duration()
+                w(f"- **Processing End**: {batch.processing_end.strftime(TIMESTAMP_FORMAT)}\n")
+                w(f"- **Total Processing Time**: {duration.total_seconds():.2f} seconds\n")
+            
+            w(f"- **Successful Extractions**: {batch.successful_count}\n")
+            w(f"- **Failed Extractions**: {batch.failed_count}\n")
+            w("\n")
+            
+            # Errors and Warnings
+            if batch.batch_errors:
+                w("## Processing Errors\n")
+                w("\n")
+                w("".join(f"- {error}\n" for error in batch.batch_errors))
+                w("\n")
+            
+            if batch.batch_warnings:
+                w("## Processing Warnings\n")
+                w("\n")
+                w("".join(f"- {warning}\n" for warning in batch.batch_warnings))
+                w("\n")
+            
+            # Footer
+            w("---\n")
+            w("\n")
+            w("*This dataset index was generated by drone_metadata_automation*\n")
+            w("*For individual video documentation, see the corresponding .md files*")
         
-        # Build markdown content
-        lines = []
+        return index_path
+    
+    def _derive_result_fields(self, results: List[VideoAnalysisResult]) -> List[Dict[str, Any]]:
+        """
+        Compute the per-result fields used by several generated files.
         
-        # Header
-        lines.append("# Drone Video Dataset Index")
-        lines.append("")
-        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Total Videos**: {len(batch.video_results)}")
-        lines.append(f"**Processing Success Rate**: {batch.get_success_rate():.1f}%")
-        lines.append("")
-        
-        # Dataset Overview
-        lines.append("## Dataset Overview")
-        lines.append("")
-        lines.append("This dataset contains drone inspection videos with extracted metadata,")
-        lines.append("GPS coordinates, technical specifications, and mission classifications.")
-        lines.append("")
-        
-        # Statistics Summary
-        lines.append("## Statistics Summary")
-        lines.append("")
-        lines.append(f"- **Total Duration**: {stats['total_duration']}")
-        lines.append(f"- **Total File Size**: {stats['total_size_mb']:.2f} MB")
-        lines.append(f"- **Average File Size**: {stats['avg_size_mb']:.2f} MB")
-        lines.append(f"- **Videos with GPS**: {stats['videos_with_gps']} ({stats['gps_percentage']:.1f}%)")
-        lines.append(f"- **Unique Resolutions**: {len(stats['resolutions'])}")
-        lines.append("")
-        
-        # Mission Breakdown
-        if stats['missions']:
-            lines.append("## Mission Breakdown")
-            lines.append("")
-            for mission_type, count in stats['missions'].items():
-                percentage = (count / len(batch.video_results)) * 100
-                lines.append(f"- **{mission_type.title()}**: {count} videos ({percentage:.1f}%)")
-            lines.append("")
-        
-        # Technical Specifications
-        lines.append("## Technical Specifications")
-        lines.append("")
-        lines.append("### Resolutions")
-        for resolution, count in stats['resolutions'].items():
-            lines.append(f"- **{resolution}**: {count} videos")
-        lines.append("")
-        
-        if stats['codecs']:
-            lines.append("### Video Codecs")
-            for codec, count in stats['codecs'].items():
-                lines.append(f"- **{codec}**: {count} videos")
-            lines.append("")
-        
-        # File Inventory
-        lines.append("## File Inventory")
-        lines.append("")
-        lines.append("### Video Files")
-        lines.append("")
-        
-        for result in batch.video_results:
+        Args:
+            results: Video analysis results of the batch
+            
+        Returns:
+            List of field dicts, parallel to ``results``
+        """
+        derived = []
+        for result in results:
             video = result.video_metadata
-            duration = video.get_duration_formatted()
-            size = f"{video.filesize_mb:.1f}MB"
-            mission = result.mission_data.mission_type.value if result.mission_data else "unknown"
-            gps_status = "GPS" if result.has_gps() else "No GPS"
-            
-            lines.append(f"- `{video.filename}` - {duration}, {size}, {mission}, {gps_status}")
-        
-        lines.append("")
-        
-        # Processing Information
-        lines.append("## Processing Information")
-        lines.append("")
-        lines.append(f"- **Batch ID**: {batch.batch_id}")
-        lines.append(f"- **Processing Start**: {batch.processing_start.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        if batch.processing_end:
-            duration = batch.get_processing_duration()
-            lines.append(f"- **Processing End**: {batch.processing_end.strftime('%Y-%m-%d %H:%M:%S')}")
-            lines.append(f"- **Total Processing Time**: {duration.total_seconds():.2f} seconds")
-        
-        lines.append(f"- **Successful Extractions**: {batch.successful_count}")
-        lines.append(f"- **Failed Extractions**: {batch.failed_count}")
-        lines.append("")
-        
-        # Errors and Warnings
-        if batch.batch_errors:
-            lines.append("## Processing Errors")
-            lines.append("")
-            for error in batch.batch_errors:
-                lines.append(f"- {error}")
-            lines.append("")
-        
-        if batch.batch_warnings:
-            lines.append("## Processing Warnings")
-            lines.append("")
-            for warning in batch.batch_warnings:
-                lines.append(f"- {warning}")
-            lines.append("")
-        
-        # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append("*This dataset index was generated by drone_metadata_automation*")
-        lines.append("*For individual video documentation, see the corresponding .md files*")
-        
-        # Write to file
-        content = "\n".join(lines)
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return index_path
+            has_gps = result.has_gps()
+            mission_type = result.mission_data.mission_type if result.mission_data else None
+            derived.append({
+                'has_gps': has_gps,
+                'gps_label': "GPS" if has_gps else "No GPS",
+                'duration_fmt': video.get_duration_formatted(),
+                'mission_type': mission_type,
+                'mission_val': mission_type.value if mission_type is not None else UNKNOWN_MISSION,
+                'filename': video.filename,
+                'size_mb': video.filesize_mb,
+                'size_mb_str': f"{video.filesize_mb:.1f}MB",
+                'duration_s': video.duration_seconds or 0,
+            })
+        return derived
     
-    def _generate_mission_readmes(self, batch: VideoProcessingBatch) -> List[Path]:
+    def _generate_mission_readmes(self, batch: VideoProcessingBatch,
+                                  mission_groups: Dict[str, List[int]],
+                                  mission_totals: Dict[str, Dict[str, Any]],
+                                  derived: List[Dict[str, Any]], generated_ts: str) -> List[Path]:
         """
         Generate README.md files for each mission type.
         
         Args:
             batch: Batch of video analysis results
+            mission_groups: Result indices grouped by mission value
+            mission_totals: Duration, size and GPS totals per mission value
+            derived: Per-result fields from _derive_result_fields
+            generated_ts: Formatted generation timestamp of the batch
             
         Returns:
             List of paths to generated README files
         """
-        mission_files = []
+        if not mission_groups:
+            return []
         
-        # Group videos by mission type
-        missions = {}
-        for result in batch.video_results:
-            if result.mission_data:
-                mission_type = result.mission_data.mission_type
-            else:
-                mission_type = MissionType.UNKNOWN
-            
-            if mission_type not in missions:
-                missions[mission_type] = []
-            missions[mission_type].append(result)
+        video_results = batch.video_results
+        
+        # Each mission writes its own README, so the writes can run concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(mission_groups))) as executor:
+            futures = [
+                executor.submit(
+                    self._write_mission_readme,
+                    mission,
+                    [(video_results[i], derived[i]) for i in indices],
+                    mission_totals[mission],
+                    generated_ts,
+                )
+                for mission, indices in mission_groups.items()
+            ]
+            return [future.result() for future in futures]
+    
+    def _write_mission_readme(self, mission: str,
+                              results: List[Tuple[VideoAnalysisResult, Dict[str, Any]]],
+                              totals: Dict[str, Any], generated_ts: str) -> Path:
+        """
+        Write the README.md file for a single mission type.
         
-        # Generate README for each mission
-        for mission_type, results in missions.items():
-            readme_path = self._get_output_path(f"{mission_type.value}_README.md")
-            
-            if self._check_file_exists(readme_path):
-                mission_files.append(readme_path)
-                continue
-            
-            # Create mission-specific README content
-            content = self._generate_mission_readme_content(mission_type, results)
-            
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        Args:
+            mission: Mission value the README describes, or UNKNOWN_MISSION
+            results: (result, derived fields) pairs of the mission's videos
+            totals: Duration, size and GPS totals of the mission
+            generated_ts: Formatted generation timestamp of the batch
             
-            mission_files.append(readme_path)
+        Returns:
+            Path to the mission README
+        """
+        readme_path = self._get_output_path(f"{mission}_README.md")
+        
+        if self._check_file_exists(readme_path):
+            return readme_path
         
-        return mission_files
+        # Create mission-specific README content
+        content = self._generate_mission_readme_content(mission, results, totals, generated_ts)
+        
+        # README content is small and already complete, so write it in one call
+        readme_path.write_bytes(content.encode('utf-8'))
+        
+        return readme_path
     
-    def _generate_mission_readme_content(self, mission_type: MissionType, results: List[VideoAnalysisResult]) -> str:
-        """Generate README content for a specific mission type."""
-        lines = []
+    def _generate_mission_readme_content(
+        self, mission: str, results: List[Tuple[VideoAnalysisResult, Dict[str, Any]]],
+        totals: Dict[str, Any], generated_ts: str
+    ) -> str:
+        """Generate README content for a specific mission type from (result, derived fields) pairs."""
+        buffer = io.StringIO()
+        w = buffer.write
         
         # Header
-        lines.append(f"# {mission_type.value.title()} Mission Videos")
-        lines.append("")
-        lines.append(f"This directory contains {len(results)} videos classified as '{mission_type.value}' missions.")
-        lines.append("")
+        w(f"# {mission.title()} Mission Videos\n")
+        w("\n")
+        w(f"This directory contains {len(results)} videos classified as '{mission}' missions.\n")
+        w("\n")
         
         # Mission statistics
-        total_duration = sum(r.video_metadata.duration_seconds or 0 for r in results)
-        total_size = sum(r.video_metadata.filesize_mb for r in results)
-        gps_count = sum(1 for r in results if r.has_gps())
+        total_duration = totals['duration_s']
+        total_size = totals['size_mb']
+        gps_count = totals['gps_count']
         
         mins = int(total_duration // 60)
         secs = int(total_duration % 60)
         
-        lines.append("## Mission Statistics")
-        lines.append("")
-        lines.append(f"- **Video Count**: {len(results)}")
-        lines.append(f"- **Total Duration**: {mins}m {secs}s")
-        lines.append(f"- **Total Size**: {total_size:.2f} MB")
-        lines.append(f"- **Videos with GPS**: {gps_count} ({(gps_count/len(results)*100):.1f}%)")
-        lines.append("")
+        w("## Mission Statistics\n")
+        w("\n")
+        w(f"- **Video Count**: {len(results)}\n")
+        w(f"- **Total Duration**: {mins}m {secs}s\n")
+        w(f"- **Total Size**: {total_size:.2f} MB\n")
+        w(f"- **Videos with GPS**: {gps_count} ({(gps_count/len(results)*100):.1f}%)\n")
+        w("\n")
         
         # Video listing
-        lines.append("## Video Files")
-        lines.append("")
-        
-        for result in results:
-            video = result.video_metadata
-            duration = video.get_duration_formatted()
-            size = f"{video.filesize_mb:.1f}MB"
-            gps_status = "GPS" if result.has_gps() else "No GPS"
-            
-            lines.append(f"### {video.filename}")
-            lines.append("")
-            lines.append(f"- **Duration**: {duration}")
-            lines.append(f"- **Size**: {size}")
-            lines.append(f"- **GPS**: {gps_status}")
+        w("## Video Files\n")
+        w("\n")
+        
+        for result, fields in results:
+            w(f"### {fields['filename']}\n")
+            w("\n")
+            w(f"- **Duration**: {fields['duration_fmt']}\n")
+            w(f"- **Size**: {fields['size_mb_str']}\n")
+            w(f"- **GPS**: {fields['gps_label']}\n")
             
             if result.technical_specs.width and result.technical_specs.height:
-                lines.append(f"- **Resolution**: {result.technical_specs.width}x{result.technical_specs.height}")
+                w(f"- **Resolution**: {result.technical_specs.width}x{result.technical_specs.height}\n")
             
-            lines.append("")
+            w("\n")
         
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+        w("---\n")
+        w("\n")
+        w(f"*Generated on {generated_ts}*")
         
-        return "\n".join(lines)
+        return buffer.getvalue()
     
-    def _generate_processing_report(self, batch: VideoProcessingBatch) -> Path:
+    def _generate_processing_report(self, batch: VideoProcessingBatch, derived: List[Dict[str, Any]],
+                                    generated_ts: str) -> Path:
         """
         Generate a detailed processing report.
         
         Args:
             batch: Batch of video analysis results
+            derived: Per-result fields from _derive_result_fields
+            generated_ts: Formatted generation timestamp of the batch
             
         Returns:
             Path to generated processing report
@@ -331,90 +469,107 @@ class DatasetIndexGenerator(BaseFormatter):
         if self._check_file_exists(report_path):
             return report_path
         
-        lines = []
-        lines.append("DRONE METADATA PROCESSING REPORT")
-        lines.append("=" * 50)
-        lines.append("")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Batch ID: {batch.batch_id}")
-        lines.append("")
-        
-        # Summary
-        lines.append("PROCESSING SUMMARY")
-        lines.append("-" * 20)
-        lines.append(f"Total Videos: {len(batch.video_results)}")
-        lines.append(f"Successful: {batch.successful_count}")
-        lines.append(f"Failed: {batch.failed_count}")
-        lines.append(f"Success Rate: {batch.get_success_rate():.1f}%")
-        lines.append("")
-        
-        # Detailed results
-        lines.append("DETAILED RESULTS")
-        lines.append("-" * 20)
-        
-        for i, result in enumerate(batch.video_results, 1):
-            video = result.video_metadata
-            lines.append(f"{i:2d}. {video.filename}")
-            lines.append(f"    Status: {'SUCCESS' if result.extraction_success else 'FAILED'}")
-            lines.append(f"    Size: {video.filesize_mb:.2f} MB")
-            lines.append(f"    Duration: {video.get_duration_formatted()}")
+        with _open_utf8_writer(report_path) as w:
+            w("DRONE METADATA PROCESSING REPORT\n")
+            w("=" * 50 + "\n")
+            w("\n")
+            w(f"Generated: {generated_ts}\n")
+            w(f"Batch ID: {batch.batch_id}\n")
+            w("\n")
             
-            if result.extraction_errors:
-                lines.append(f"    Errors: {len(result.extraction_errors)}")
-                for error in result.extraction_errors[:2]:  # Show first 2 errors
-                    lines.append(f"      - {error}")
+            # Summary
+            w("PROCESSING SUMMARY\n")
+            w("-" * 20 + "\n")
+            w(f"Total Videos: {len(batch.video_results)}\n")
+            w(f"Successful: {batch.successful_count}\n")
+            w(f"Failed: {batch.failed_count}\n")
+            w(f"Success Rate: {batch.get_success_rate():.1f}%\n")
+            w("\n")
             
-            lines.append("")
-        
-        # Write report
-        content = "\n".join(lines)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            # Detailed results
+            w("DETAILED RESULTS\n")
+            w("-" * 20)
+            
+            fmt = REPORT_RECORD_FMT.format
+            for i, (result, d) in enumerate(zip(batch.video_results, derived), 1):
+                block = fmt(i, 'SUCCESS' if result.extraction_success else 'FAILED', **d)
+                
+                errors = result.extraction_errors
+                if errors:
+                    # Show first 2 errors
+                    block += f"    Errors: {len(errors)}\n" + "".join(f"      - {error}\n" for error in islice(errors, 2))
+                
+                # Records are separated by a blank line; the report ends with the last record
+                w("\n" + block)
         
         return report_path
     
-    def _calculate_dataset_statistics(self, results: List[VideoAnalysisResult]) -> Dict[str, Any]:
-        """Calculate comprehensive dataset statistics."""
+    def _calculate_dataset_statistics(
+        self, results: List[VideoAnalysisResult], derived: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, List[int]], Dict[str, Dict[str, Any]]]:
+        """
+        Calculate comprehensive dataset statistics in a single pass.
+        
+        The same pass groups the result indices by mission value (results
+        without mission data fall under UNKNOWN_MISSION) and totals
+        their duration, size and GPS coverage for the mission READMEs.
+        
+        Args:
+            results: Video analysis results of the batch
+            derived: Per-result fields from _derive_result_fields
+        
+        Returns:
+            Tuple of (statistics, mission groups, mission totals)
+        """
         stats = {
             'total_duration': 0,
             'total_size_mb': 0,
             'avg_size_mb': 0,
             'videos_with_gps': 0,
             'gps_percentage': 0,
-            'resolutions': {},
-            'codecs': {},
-            'missions': {}
+            'pct_per_video': 0,
+            'resolutions': Counter(),
+            'codecs': Counter(),
+            'missions': Counter()
         }
+        resolutions = stats['resolutions']
+        codecs = stats['codecs']
+        missions = stats['missions']
+        mission_groups = defaultdict(list)
+        mission_totals = defaultdict(lambda: {'duration_s': 0, 'size_mb': 0, 'gps_count': 0})
         
         total_duration_seconds = 0
         
-        for result in results:
-            video = result.video_metadata
+        for i, (result, fields) in enumerate(zip(results, derived)):
             specs = result.technical_specs
             
             # Duration and size
-            if video.duration_seconds:
-                total_duration_seconds += video.duration_seconds
-            stats['total_size_mb'] += video.filesize_mb
+            total_duration_seconds += fields['duration_s']
+            stats['total_size_mb'] += fields['size_mb']
             
             # GPS
-            if result.has_gps():
+            if fields['has_gps']:
                 stats['videos_with_gps'] += 1
             
             # Resolutions
             if specs.width and specs.height:
                 resolution = f"{specs.width}x{specs.height}"
-                stats['resolutions'][resolution] = stats['resolutions'].get(resolution, 0) + 1
+                resolutions[resolution] += 1
             
             # Codecs
             if specs.video_codec:
-                codec = specs.video_codec
-                stats['codecs'][codec] = stats['codecs'].get(codec, 0) + 1
+                codecs[specs.video_codec] += 1
             
             # Missions
-            if result.mission_data:
-                mission = result.mission_data.mission_type.value
-                stats['missions'][mission] = stats['missions'].get(mission, 0) + 1
+            mission = fields['mission_val']
+            if fields['mission_type'] is not None:
+                missions[mission] += 1
+            mission_groups[mission].append(i)
+            
+            totals = mission_totals[mission]
+            totals['duration_s'] += fields['duration_s']
+            totals['size_mb'] += fields['size_mb']
+            totals['gps_count'] += fields['has_gps']
         
         # Calculate derived statistics
         mins = int(total_duration_seconds // 60)
@@ -422,10 +577,13 @@ class DatasetIndexGenerator(BaseFormatter):
         stats['total_duration'] = f"{mins}m {secs}s"
         
         if results:
+            # Percentage contributed by a single video, shared by every percentage of the index
+            pct_per_video = 100.0 / len(results)
+            stats['pct_per_video'] = pct_per_video
             stats['avg_size_mb'] = stats['total_size_mb'] / len(results)
-            stats['gps_percentage'] = (stats['videos_with_gps'] / len(results)) * 100
+            stats['gps_percentage'] = stats['videos_with_gps'] * pct_per_video
         
-        return stats
+        return stats, mission_groups, mission_totals
     
     def get_formatter_info(self) -> dict:
         """Get information about this formatter."""
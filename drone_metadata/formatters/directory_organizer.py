@@ -9,10 +9,15 @@ Phase 2 Implementation: Automatic organization matching Pilot04 format with
 box/, safety/, thumbnails/ structure.
 """
 
+import itertools
 import logging
+import os
 import shutil
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -22,6 +27,66 @@ from .base_formatter import BaseFormatter, FormatterConfig, FormatterError
 logger = logging.getLogger(__name__)
 
 
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry]:
+    """Yield the file entries below a directory, recursing without extra stat calls."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError as e:
+        logger.debug(f"Could not scan directory {path}: {e}")
+
+
+class _OutputFileIndex:
+    """
+    In-memory index of the files under the output directory, searchable by name prefix.
+    
+    Built from a single recursive scan and kept current as files are organized,
+    so each video looks up its files without walking the output tree again.
+    """
+    
+    __slots__ = ('_names', '_paths')
+    
+    def __init__(self, root: Path):
+        entries = sorted((entry.name, entry.path) for entry in _scandir_recursive(str(root)))
+        self._names: List[str] = [name for name, _ in entries]
+        self._paths: List[str] = [path for _, path in entries]
+    
+    def find_prefix(self, prefix: str) -> List[Path]:
+        """Return the indexed files whose name starts with prefix."""
+        names = self._names
+        matches = []
+        i = bisect_left(names, prefix)
+        while i < len(names) and names[i].startswith(prefix):
+            matches.append(Path(self._paths[i]))
+            i += 1
+        return matches
+    
+    def _position(self, path: Path) -> Optional[int]:
+        name, path_str = path.name, str(path)
+        for i in range(bisect_left(self._names, name), bisect_right(self._names, name)):
+            if self._paths[i] == path_str:
+                return i
+        return None
+    
+    def add(self, path: Path) -> None:
+        """Add a file to the index if it is not already present."""
+        if self._position(path) is None:
+            i = bisect_right(self._names, path.name)
+            self._names.insert(i, path.name)
+            self._paths.insert(i, str(path))
+    
+    def discard(self, path: Path) -> None:
+        """Remove a file from the index if present."""
+        i = self._position(path)
+        if i is not None:
+            del self._names[i]
+            del self._paths[i]
+
+
 @dataclass
 class DirectoryStructure:
     """Configuration for mission-based directory structure."""
@@ -77,18 +142,54 @@ class DirectoryOrganizer(BaseFormatter):
         
         # Directory structure configuration
         self.structure = DirectoryStructure()
+        self._output_dir_prefix = str(self._output_dir) + os.sep  # for relative paths by prefix stripping
+        
+        # File type to subdirectory mapping - thumbnails nested in metadata
+        self._thumbnails_rel_path = f"{self.structure.metadata_subdir}/{self.structure.thumbnails_subdir}"
+        self._file_mappings: Dict[str, str] = {
+            '.jpg': self._thumbnails_rel_path,
+            '.png': self._thumbnails_rel_path,
+            '.md': self.structure.metadata_subdir,
+            '.json': self.structure.metadata_subdir,
+            '.csv': self.structure.semantic_subdir,
+            '.html': self.structure.reports_subdir,
+            '.txt': self.structure.reports_subdir,
+        }
         
         # File organization settings
         self.move_files = getattr(config, 'move_files', True)  # Move vs copy files
         self.preserve_originals = getattr(config, 'preserve_originals', False)
         self.create_symlinks = getattr(config, 'create_symlinks', False)  # Create symlinks to original locations
         
+        # Guards the tracking state and output tree index when videos are organized concurrently
+        self._lock = threading.RLock()
+        self._name_locks = tuple(threading.Lock() for _ in range(64))
+        
         # Tracking
-        self.created_directories: Set[Path] = set()
-        self.organized_files: Dict[str, Path] = {}  # original_path -> new_path
+        self._dir_cache: Dict[Union[str, Path], Path] = {}  # requested dir -> created full path
+        self._mission_structure_done: Dict[str, Path] = {}  # mission dir -> mission path
+        self.organized_files: List[Tuple[str, Path]] = []  # (original_path, new_path)
+        
+        # Index of the output tree, mission paths and per-video file matches, shared by the videos of a batch
+        self._scan_index: Optional[_OutputFileIndex] = None
+        self._mission_path_cache: Dict[MissionType, Path] = {}
+        self._batch_matches: Dict[int, List[Path]] = {}  # id(result) -> files claimed by that video
+        
+        # Device ids used to detect moves that stay on the output file system
+        self._output_dev: Optional[int] = None
+        self._dev_cache: Dict[Path, int] = {}  # source directory -> st_dev
+        
+        # Key and path of the last batch summary, to skip re-rendering an unchanged one
+        self._last_summary_hash: Optional[int] = None
+        self._last_summary_path: Optional[Path] = None
         
         logger.info(f"DirectoryOrganizer initialized with move_files={self.move_files}")
     
+    @property
+    def created_directories(self) -> Set[Path]:
+        """Directories created (or confirmed to exist) by this organizer."""
+        return set(self._dir_cache.values())
+    
     def get_supported_extensions(self) -> List[str]:
         """Return supported file extensions (all file types)."""
         return [".*"]  # All files
@@ -107,12 +208,12 @@ class DirectoryOrganizer(BaseFormatter):
         self._log_processing_start("directory organization", video_name)
         
         try:
-            # Determine mission type and target directory
+            # Determine mission type and target directory, resolved up front for batches
             mission_type = result.mission_data.mission_type if result.mission_data else MissionType.BOX
-            mission_dir = self.structure.get_mission_dir(mission_type)
-            
-            # Create mission directory structure
-            mission_path = self._ensure_mission_structure(mission_dir)
+            mission_path = self._mission_path_cache.get(mission_type)
+            if mission_path is None:
+                # Create mission directory structure
+                mission_path = self._ensure_mission_structure(self.structure.get_mission_dir(mission_type))
             
             # Organize any existing output files for this video
             organized_paths = self._organize_video_files(result, mission_path)
@@ -140,14 +241,33 @@ class DirectoryOrganizer(BaseFormatter):
         # Create batch reports directory
         batch_reports_path = self._ensure_directory(self.structure.batch_reports_dir)
         
-        # Organize each video
-        for result in batch.video_results:
-            try:
-                paths = self.format_single_video(result)
-                all_organized_paths.extend(paths)
-            except FormatterError:
-                # Error already logged in format_single_video
-                continue
+        # Scan the output tree and set up the batch's mission directories once
+        self._scan_index = self._scan_output_tree()
+        try:
+            mission_types = dict.fromkeys(
+                result.mission_data.mission_type if result.mission_data else MissionType.BOX
+                for result in batch.video_results
+            )
+            self._mission_path_cache = {
+                mission_type: self._ensure_mission_structure(self.structure.get_mission_dir(mission_type))
+                for mission_type in mission_types
+            }
+            self._batch_matches = self._claim_video_files(batch.video_results)
+            
+            # Organize the videos on a thread pool; the work is dominated by file system calls
+            if batch.video_results:
+                with ThreadPoolExecutor(max_workers=self._get_io_workers(len(batch.video_results))) as executor:
+                    futures = [executor.submit(self.format_single_video, result) for result in batch.video_results]
+                    for future in futures:
+                        try:
+                            all_organized_paths.extend(future.result())
+                        except FormatterError:
+                            # Error already logged in format_single_video
+                            continue
+        finally:
+            self._scan_index = None
+            self._mission_path_cache = {}
+            self._batch_matches = {}
         
         # Create batch organization summary
         summary_path = self._create_batch_summary(batch, batch_reports_path)
@@ -158,68 +278,106 @@ class DirectoryOrganizer(BaseFormatter):
     
     def _ensure_mission_structure(self, mission_dir: str) -> Path:
         """Create complete directory structure for a mission type."""
-        mission_path = self._ensure_directory(mission_dir)
-        
-        # Create subdirectories
-        self._ensure_directory(mission_path / self.structure.metadata_subdir)
-        # Create thumbnails nested inside metadata
-        self._ensure_directory(mission_path / self.structure.metadata_subdir / self.structure.thumbnails_subdir)
-        self._ensure_directory(mission_path / self.structure.reports_subdir)
-        self._ensure_directory(mission_path / self.structure.semantic_subdir)
+        mission_path = self._mission_structure_done.get(mission_dir)
+        if mission_path is not None:
+            return mission_path
         
+        with self._lock:
+            structure = self.structure
+            mission_path = self._ensure_directory(mission_dir)
+            # Subdirectories are requested relative to the output directory
+            mission_rel = Path(mission_dir)
+            metadata_rel = mission_rel / structure.metadata_subdir
+            
+            # Create subdirectories
+            self._ensure_directory(metadata_rel)
+            # Create thumbnails nested inside metadata
+            self._ensure_directory(metadata_rel / structure.thumbnails_subdir)
+            self._ensure_directory(mission_rel / structure.reports_subdir)
+            self._ensure_directory(mission_rel / structure.semantic_subdir)
+            
+            self._mission_structure_done[mission_dir] = mission_path
         return mission_path
     
     def _ensure_directory(self, dir_path: Union[str, Path]) -> Path:
         """Ensure directory exists, create if needed."""
-        if isinstance(dir_path, str):
-            full_path = Path(self.config.output_directory) / dir_path
-        else:
-            full_path = Path(self.config.output_directory) / dir_path
-        
-        if full_path not in self.created_directories:
-            full_path.mkdir(parents=True, exist_ok=True)
-            self.created_directories.add(full_path)
+        full_path = self._dir_cache.get(dir_path)
+        if full_path is None:
+            with self._lock:
+                full_path = self._output_dir / dir_path
+                full_path.mkdir(parents=True, exist_ok=True)
+                self._dir_cache[dir_path] = full_path
             logger.debug(f"Created directory: {full_path}")
         
         return full_path
     
+    def _scan_output_tree(self) -> _OutputFileIndex:
+        """Index every file currently under the output directory."""
+        return _OutputFileIndex(self._output_dir)
+    
+    def _claim_video_files(self, results: List[VideoAnalysisResult]) -> Dict[int, List[Path]]:
+        """
+        Split the indexed files into disjoint groups, one per video, keyed by id(result).
+        
+        One video's stem can be a prefix of another's (DJI_001 and DJI_0010), so
+        a file is claimed by the longest stem it starts with. Videos organized
+        concurrently then never move the same file.
+        """
+        claimed: Set[Path] = set()
+        matches: Dict[int, List[Path]] = {}
+        by_stem_length = sorted(
+            results, key=lambda result: len(os.path.splitext(result.video_metadata.filename)[0]), reverse=True
+        )
+        for result in by_stem_length:
+            stem = os.path.splitext(result.video_metadata.filename)[0]
+            group = [path for path in self._scan_index.find_prefix(stem) if path not in claimed]
+            claimed.update(group)
+            matches[id(result)] = group
+        return matches
+    
     def _organize_video_files(self, result: VideoAnalysisResult, mission_path: Path) -> List[Path]:
         """Organize all files related to a video into mission directory structure."""
         organized_paths = []
         video_name = result.video_metadata.filename
         
-        # Define file type to subdirectory mapping - thumbnails nested in metadata
-        file_mappings = {
-            '.jpg': f"{self.structure.metadata_subdir}/{self.structure.thumbnails_subdir}",
-            '.png': f"{self.structure.metadata_subdir}/{self.structure.thumbnails_subdir}",
-            '.md': self.structure.metadata_subdir,
-            '.json': self.structure.metadata_subdir,
-            '.csv': self.structure.semantic_subdir,
-            '.html': self.structure.reports_subdir,
-            '.txt': self.structure.reports_subdir,
-        }
+        file_mappings = self._file_mappings
+        default_subdir = self.structure.metadata_subdir
         
-        # Look for existing files that might need organization
-        base_output_dir = Path(self.config.output_directory)
-        
-        # Search for files matching this video
-        for file_pattern in [f"{video_name}*", f"{Path(video_name).stem}*"]:
-            for existing_file in base_output_dir.rglob(file_pattern):
-                if existing_file.is_file():
-                    # Skip if file is already in the correct mission subdirectory
-                    if self._is_already_organized(existing_file, mission_path):
-                        organized_paths.append(existing_file)
-                        continue
-                    
+        # Look for existing files that might need organization, using the batch
+        # index when there is one and a fresh scan for standalone calls
+        owns_index = self._scan_index is None
+        if owns_index:
+            self._scan_index = self._scan_output_tree()
+        
+        try:
+            # Search for files matching this video. The filename starts with the
+            # stem, so a single stem-prefix lookup covers both; each path is
+            # reported once. A batch has already split the matches between its videos.
+            seen: Set[Path] = set()
+            matches = self._batch_matches.get(id(result))
+            if matches is None:
+                with self._lock:
+                    matches = self._scan_index.find_prefix(os.path.splitext(video_name)[0])
+            
+            for existing_file in matches:
+                # Skip if file is already in the correct mission subdirectory
+                if self._is_already_organized(existing_file, mission_path):
+                    organized_file = existing_file
+                else:
                     # Determine target subdirectory
                     file_extension = existing_file.suffix.lower()
-                    target_subdir = file_mappings.get(file_extension, self.structure.metadata_subdir)
+                    target_subdir = file_mappings.get(file_extension, default_subdir)
                     target_dir = mission_path / target_subdir
                     
                     # Move the file to organized location
                     organized_file = self._organize_file(existing_file, target_dir)
-                    if organized_file:
-                        organized_paths.append(organized_file)
+                
+                if organized_file and organized_file not in seen:
+                    seen.add(organized_file)
+                    organized_paths.append(organized_file)
+        finally:
+            if owns_index:
+                self._scan_index = None
         
         return organized_paths
     
@@ -240,23 +398,11 @@ class DirectoryOrganizer(BaseFormatter):
         mission_dir = self.structure.get_mission_dir(mission_type)
         
         # Create mission directory structure
-        mission_path = self._ensure_mission_structure(mission_dir)
+        self._ensure_mission_structure(mission_dir)
         
-        # Define file type to subdirectory mapping - thumbnails nested in metadata
-        file_mappings = {
-            '.jpg': f"{self.structure.metadata_subdir}/{self.structure.thumbnails_subdir}",
-            '.png': f"{self.structure.metadata_subdir}/{self.structure.thumbnails_subdir}",
-            '.md': self.structure.metadata_subdir,
-            '.json': self.structure.metadata_subdir,
-            '.csv': self.structure.semantic_subdir,
-            '.html': self.structure.reports_subdir,
-            '.txt': self.structure.reports_subdir,
-        }
-        
-        # Determine target subdirectory
-        target_subdir = file_mappings.get(file_extension.lower(), self.structure.metadata_subdir)
-        target_dir = mission_path / target_subdir
-        target_dir.mkdir(parents=True, exist_ok=True)
+        # Determine target subdirectory, relative to the output directory
+        target_subdir = self._file_mappings.get(file_extension.lower(), self.structure.metadata_subdir)
+        target_dir = self._ensure_directory(Path(mission_dir) / target_subdir)
         
         # Generate filename - use provided filename if available, otherwise generate from video name
         if filename:
@@ -268,7 +414,7 @@ class DirectoryOrganizer(BaseFormatter):
             elif file_extension in ['.jpg', '.png']:
                 final_filename = f"{video_name}_thumbnail{file_extension}"
             else:
-                final_filename = f"{Path(video_name).stem}{file_extension}"
+                final_filename = f"{os.path.splitext(video_name)[0]}{file_extension}"
             
         return target_dir / final_filename
     
@@ -281,65 +427,120 @@ class DirectoryOrganizer(BaseFormatter):
         except ValueError:
             return False
     
+    def _is_on_output_filesystem(self, source_path: Path) -> bool:
+        """Check whether a file lives on the same file system as the output directory."""
+        if self._output_dev is None:
+            self._output_dev = os.stat(self._output_dir).st_dev
+        
+        parent = source_path.parent
+        source_dev = self._dev_cache.get(parent)
+        if source_dev is None:
+            source_dev = self._dev_cache[parent] = os.stat(parent).st_dev
+        return source_dev == self._output_dev
+    
     def _organize_file(self, source_path: Path, target_dir: Path) -> Optional[Path]:
         """Move or copy a file to the target directory."""
-        try:
-            target_path = target_dir / source_path.name
-            
-            # Check if source and target are the same file
-            if source_path.resolve() == target_path.resolve():
-                logger.debug(f"File already in correct location: {source_path}")
-                return target_path
-            
-            # Handle existing files
-            if target_path.exists():
-                if not self.config.overwrite_existing:
-                    logger.warning(f"Target file exists, skipping: {target_path}")
+        # The target keeps the source's file name, so holding that name's lock
+        # serializes every thread that could check or move either path
+        with self._name_locks[hash(source_path.name) % len(self._name_locks)]:
+            try:
+                target_path = target_dir / source_path.name
+                
+                # Check if source and target are the same file. Identical paths need no
+                # file system access; otherwise they can only be the same file if the
+                # target exists, and only then are both resolved.
+                if os.fspath(source_path) == os.fspath(target_path):
+                    same_file = target_exists = True
+                else:
+                    target_exists = target_path.exists()
+                    same_file = target_exists and os.path.realpath(source_path) == os.path.realpath(target_path)
+                
+                if same_file:
+                    logger.debug(f"File already in correct location: {source_path}")
                     return target_path
+                
+                # Handle existing files
+                if target_exists:
+                    if not self.config.overwrite_existing:
+                        logger.warning(f"Target file exists, skipping: {target_path}")
+                        return target_path
+                    else:
+                        logger.info(f"Overwriting existing file: {target_path}")
+                
+                # Ensure target directory exists
+                target_dir.mkdir(parents=True, exist_ok=True)
+                
+                # Move or copy the file
+                moved = self.move_files and not self.preserve_originals
+                if moved:
+                    try:
+                        if not self._is_on_output_filesystem(source_path):
+                            raise OSError("source is on another file system")
+                        # A single rename, without shutil.move's probing and copy fallback
+                        os.replace(source_path, target_path)
+                    except OSError:
+                        shutil.move(str(source_path), str(target_path))
+                    logger.info(f"Moved: {source_path} -> {target_path}")
                 else:
-                    logger.info(f"Overwriting existing file: {target_path}")
-            
-            # Ensure target directory exists
-            target_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Move or copy the file
-            if self.move_files and not self.preserve_originals:
-                shutil.move(str(source_path), str(target_path))
-                logger.info(f"Moved: {source_path} -> {target_path}")
-            else:
-                shutil.copy2(str(source_path), str(target_path))
-                logger.info(f"Copied: {source_path} -> {target_path}")
-            
-            # Create symlink to original location if requested
-            if self.create_symlinks and self.move_files:
-                try:
-                    source_path.symlink_to(target_path)
-                    logger.debug(f"Created symlink: {source_path} -> {target_path}")
-                except (OSError, NotImplementedError) as e:
-                    logger.warning(f"Could not create symlink: {e}")
-            
-            self.organized_files[str(source_path)] = target_path
-            return target_path
-            
-        except Exception as e:
-            logger.error(f"Failed to organize file {source_path}: {e}")
-            return None
+                    shutil.copy2(str(source_path), str(target_path))
+                    logger.info(f"Copied: {source_path} -> {target_path}")
+                
+                # Keep the output tree index in step with the file system
+                scan_index = self._scan_index
+                if scan_index is not None:
+                    with self._lock:
+                        if moved:
+                            scan_index.discard(source_path)
+                        scan_index.add(target_path)
+                
+                # Create symlink to original location if requested
+                if self.create_symlinks and self.move_files:
+                    try:
+                        source_path.symlink_to(target_path)
+                        logger.debug(f"Created symlink: {source_path} -> {target_path}")
+                        if scan_index is not None:
+                            with self._lock:
+                                scan_index.add(source_path)
+                    except (OSError, NotImplementedError) as e:
+                        logger.warning(f"Could not create symlink: {e}")
+                
+                with self._lock:
+                    self.organized_files.append((str(source_path), target_path))
+                return target_path
+                
+            except Exception as e:
+                logger.error(f"Failed to organize file {source_path}: {e}")
+                return None
     
     def _create_batch_summary(self, batch: VideoProcessingBatch, batch_reports_path: Path) -> Optional[Path]:
         """Create a summary report of batch organization."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            summary_path = batch_reports_path / f"organization_summary_{timestamp}.md"
-            
             # Count files by mission type
             mission_counts = {}
             for result in batch.video_results:
                 mission_type = result.mission_data.mission_type if result.mission_data else MissionType.BOX
                 mission_dir = self.structure.get_mission_dir(mission_type)
                 mission_counts[mission_dir] = mission_counts.get(mission_dir, 0) + 1
+            sorted_counts = sorted(mission_counts.items())
+            structure = self.structure
+            
+            # organized_files only grows, so its length identifies its contents
+            summary_hash = hash((
+                len(batch.video_results),
+                len(self.organized_files),
+                len(self.created_directories),
+                tuple(sorted_counts),
+            ))
+            last_path = self._last_summary_path
+            if summary_hash == self._last_summary_hash and last_path is not None and last_path.exists():
+                logger.debug(f"Batch organization unchanged, reusing summary: {last_path}")
+                return last_path
             
-            # Generate summary content
-            content = f"""# Batch Organization Summary
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            summary_path = batch_reports_path / f"organization_summary_{timestamp}.md"
+            
+            # Generate summary content as encoded chunks, streamed to the file
+            parts: List[str] = [f"""# Batch Organization Summary
 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 ## Overview
@@ -348,38 +549,37 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 - Directories created: {len(self.created_directories)}
 
 ## Mission Type Distribution
-"""
+"""]
             
-            for mission_dir, count in sorted(mission_counts.items()):
-                content += f"- {mission_dir}: {count} videos\n"
+            parts.extend(f"- {mission_dir}: {count} videos\n" for mission_dir, count in sorted_counts)
             
-            content += f"""
+            parts.append(f"""
 ## Directory Structure Created
 ```
 {self.config.output_directory}/
-"""
+""")
             
             # Add directory structure
-            for mission_dir, count in sorted(mission_counts.items()):
+            for mission_dir, count in sorted_counts:
                 if count > 0:
-                    content += f"├── {mission_dir}/\n"
-                    content += f"│   ├── {self.structure.thumbnails_subdir}/\n"
-                    content += f"│   ├── {self.structure.metadata_subdir}/\n"
-                    content += f"│   ├── {self.structure.reports_subdir}/\n"
-                    content += f"│   └── {self.structure.semantic_subdir}/\n"
+                    parts.append(
+                        f"├── {mission_dir}/\n"
+                        f"│   ├── {structure.thumbnails_subdir}/\n"
+                        f"│   ├── {structure.metadata_subdir}/\n"
+                        f"│   ├── {structure.reports_subdir}/\n"
+                        f"│   └── {structure.semantic_subdir}/\n"
+                    )
             
-            content += f"├── {self.structure.batch_reports_dir}/\n"
-            content += f"└── {self.structure.logs_dir}/\n```\n"
+            parts.append(f"├── {structure.batch_reports_dir}/\n└── {structure.logs_dir}/\n```\n")
             
-            # File organization details
+            # Write summary, streaming the (optionally capped) file listing line by line
+            chunks = [part.encode('utf-8') for part in parts]
             if self.organized_files:
-                content += "\n## File Organization Details\n"
-                for original, new_path in self.organized_files.items():
-                    content += f"- `{Path(original).name}` -> `{new_path.relative_to(Path(self.config.output_directory))}`\n"
-            
-            # Write summary
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                chunks.append(b"\n## File Organization Details\n")
+                chunks = itertools.chain(chunks, self._iter_organized_file_lines())
+            self._write_byte_chunks(summary_path, chunks)
+            self._last_summary_hash = summary_hash
+            self._last_summary_path = summary_path
             
             logger.info(f"Created batch organization summary: {summary_path}")
             return summary_path
@@ -388,16 +588,39 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
             logger.error(f"Failed to create batch summary: {e}")
             return None
     
+    def _iter_organized_file_lines(self) -> Iterator[bytes]:
+        """Yield encoded summary lines for organized files, capped at summary_max_files."""
+        output_dir_prefix = self._output_dir_prefix
+        max_files = self.config.summary_max_files
+        listed = self.organized_files if max_files is None else self.organized_files[:max_files]
+        
+        for original, new_path in listed:
+            rel_path = str(new_path).removeprefix(output_dir_prefix)
+            yield f"- `{os.path.basename(original)}` -> `{rel_path}`\n".encode('utf-8')
+        
+        remaining = len(self.organized_files) - len(listed)
+        if remaining > 0:
+            yield f"- *({remaining} more…)*\n".encode('utf-8')
+    
     def get_directory_structure(self) -> Dict[str, Any]:
         """Get information about the created directory structure."""
         structure_info = {}
+        output_dir_prefix = self._output_dir_prefix
         
         for directory in sorted(self.created_directories):
-            rel_path = directory.relative_to(Path(self.config.output_directory))
-            structure_info[str(rel_path)] = {
-                "absolute_path": str(directory),
-                "exists": directory.exists(),
-                "file_count": len(list(directory.iterdir())) if directory.exists() else 0
+            # One scandir per directory both checks existence and counts entries
+            try:
+                with os.scandir(directory) as entries:
+                    file_count = sum(1 for _ in entries)
+                exists = True
+            except FileNotFoundError:
+                file_count, exists = 0, False
+            
+            directory_str = str(directory)
+            structure_info[directory_str.removeprefix(output_dir_prefix)] = {
+                "absolute_path": directory_str,
+                "exists": exists,
+                "file_count": file_count
             }
         
         return structure_info
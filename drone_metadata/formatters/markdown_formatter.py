@@ -7,12 +7,19 @@ individual .md documentation files for drone videos, similar to
 the format used in the Pilot04_Field_Test_April_25 example.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from .base_formatter import BaseFormatter, FormatterError
-from ..models import VideoAnalysisResult, VideoProcessingBatch
+from ..models import (
+    GPSData, MissionData, TechnicalSpecs, VideoAnalysisResult, VideoMetadata, VideoProcessingBatch
+)
+
+# Timestamp format used throughout the generated documentation
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 class MarkdownFormatter(BaseFormatter):
@@ -58,8 +65,7 @@ class MarkdownFormatter(BaseFormatter):
             markdown_content = self._generate_video_markdown(result)
             
             # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            self._write_text_file(output_path, markdown_content)
             
             self._log_processing_complete("markdown generation", video_name, output_path)
             return [output_path]
@@ -80,14 +86,18 @@ class MarkdownFormatter(BaseFormatter):
             List of paths to generated .md files
         """
         output_paths = []
+        if not batch.video_results:
+            return output_paths
         
-        for result in batch.video_results:
-            try:
-                paths = self.format_single_video(result)
-                output_paths.extend(paths)
-            except FormatterError:
-                # Error already logged in format_single_video
-                continue
+        # Each video writes its own file, so the I/O-bound work runs on a thread pool
+        with ThreadPoolExecutor(max_workers=self._get_io_workers(len(batch.video_results))) as executor:
+            futures = [executor.submit(self.format_single_video, result) for result in batch.video_results]
+            for future in futures:
+                try:
+                    output_paths.extend(future.result())
+                except FormatterError:
+                    # Error already logged in format_single_video
+                    continue
         
         return output_paths
     
@@ -102,179 +112,196 @@ class MarkdownFormatter(BaseFormatter):
             Markdown content string
         """
         video = result.video_metadata
-        specs = result.technical_specs
-        gps = result.gps_data
-        mission = result.mission_data
         
-        # Start building markdown content
-        lines = []
+        return "".join((
+            self._format_video_section(video),
+            self._format_specs_section(result.technical_specs),
+            self._format_gps_section(result.gps_data),
+            self._format_mission_section(result.mission_data),
+            self._format_dji_section(result.dji_metadata),
+            self._format_processing_section(result),
+            self._format_media_section(video),
+            # Footer
+            "---\n"
+            "\n"
+            f"*Generated by drone_metadata_automation on {datetime.now().strftime(TIMESTAMP_FORMAT)}*",
+        ))
+    
+    def _format_video_section(self, video: VideoMetadata) -> str:
+        """Format the title and basic video information."""
+        duration = ""
+        if video.duration_seconds:
+            duration = f"- **Duration**: {video.get_duration_formatted()}\n"
         
-        # Title
-        lines.append(f"# {video.filename}")
-        lines.append("")
+        last_modified = ""
+        if video.last_modified:
+            last_modified = f"- **Last Modified**: {video.last_modified.strftime(TIMESTAMP_FORMAT)}\n"
         
-        # Basic video information
-        lines.append("## Video Information")
-        lines.append("")
-        lines.append(f"- **Filename**: {video.filename}")
-        lines.append(f"- **File Size**: {video.filesize_mb:.2f} MB ({video.filesize_bytes:,} bytes)")
+        return (
+            f"# {video.filename}\n"
+            "\n"
+            "## Video Information\n"
+            "\n"
+            f"- **Filename**: {video.filename}\n"
+            f"- **File Size**: {video.filesize_mb:.2f} MB ({video.filesize_bytes:,} bytes)\n"
+            f"{duration}"
+            f"{last_modified}"
+            f"- **Analysis Date**: {video.extraction_time.strftime(TIMESTAMP_FORMAT)}\n"
+            "\n"
+        )
+    
+    def _format_specs_section(self, specs: TechnicalSpecs) -> str:
+        """Format the technical specifications, or nothing if none are known."""
+        if not (specs.width or specs.height or specs.video_codec):
+            return ""
         
-        if video.duration_seconds:
-            lines.append(f"- **Duration**: {video.get_duration_formatted()}")
+        resolution = ""
+        if specs.width and specs.height:
+            resolution = f"- **Resolution**: {specs.width}x{specs.height}\n"
+            if specs.is_4k():
+                resolution += "  - 4K Ultra HD quality\n"
+            elif specs.is_hd():
+                resolution += "  - HD quality\n"
         
-        if video.last_modified:
-            lines.append(f"- **Last Modified**: {video.last_modified.strftime('%Y-%m-%d %H:%M:%S')}")
+        video_codec = f"- **Video Codec**: {specs.video_codec}\n" if specs.video_codec else ""
+        audio_codec = f"- **Audio Codec**: {specs.audio_codec}\n" if specs.audio_codec else ""
+        container = f"- **Container Format**: {specs.container_format}\n" if specs.container_format else ""
+        framerate = self._format_framerate(specs.framerate) if specs.framerate else ""
+        bitrate = f"- **Video Bitrate**: {specs.bitrate_video:,} bps\n" if specs.bitrate_video else ""
         
-        lines.append(f"- **Analysis Date**: {video.extraction_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        aspect_ratio = specs.get_aspect_ratio()
+        aspect = f"- **Aspect Ratio**: {aspect_ratio:.2f}:1\n" if aspect_ratio else ""
         
-        # Technical specifications
-        if specs.width or specs.height or specs.video_codec:
-            lines.append("## Technical Specifications")
-            lines.append("")
-            
-            if specs.width and specs.height:
-                lines.append(f"- **Resolution**: {specs.width}x{specs.height}")
-                if specs.is_4k():
-                    lines.append("  - 4K Ultra HD quality")
-                elif specs.is_hd():
-                    lines.append("  - HD quality")
-            
-            if specs.video_codec:
-                lines.append(f"- **Video Codec**: {specs.video_codec}")
-            
-            if specs.audio_codec:
-                lines.append(f"- **Audio Codec**: {specs.audio_codec}")
-            
-            if specs.container_format:
-                lines.append(f"- **Container Format**: {specs.container_format}")
-            
-            if specs.framerate:
-                # Handle framerate which might be a string like "30/1" or a float
-                try:
-                    if isinstance(specs.framerate, str) and '/' in specs.framerate:
-                        # Parse fractional framerate like "30/1"
-                        num, den = specs.framerate.split('/')
-                        framerate_float = float(num) / float(den)
-                        lines.append(f"- **Frame Rate**: {framerate_float:.1f} fps")
-                    else:
-                        framerate_float = float(specs.framerate)
-                        lines.append(f"- **Frame Rate**: {framerate_float:.1f} fps")
-                except (ValueError, ZeroDivisionError):
-                    lines.append(f"- **Frame Rate**: {specs.framerate}")
-            
-            if specs.bitrate_video:
-                lines.append(f"- **Video Bitrate**: {specs.bitrate_video:,} bps")
-            
-            aspect_ratio = specs.get_aspect_ratio()
-            if aspect_ratio:
-                lines.append(f"- **Aspect Ratio**: {aspect_ratio:.2f}:1")
-            
-            lines.append("")
+        return (
+            "## Technical Specifications\n"
+            "\n"
+            f"{resolution}{video_codec}{audio_codec}{container}{framerate}{bitrate}{aspect}"
+            "\n"
+        )
+    
+    def _format_framerate(self, framerate) -> str:
+        """Format the frame rate line; framerate may be a float or a string like "30/1"."""
+        # Fast path: numeric framerates (the common case for DJI footage)
+        if isinstance(framerate, (int, float)):
+            return f"- **Frame Rate**: {framerate:.1f} fps\n"
         
-        # GPS information
-        if gps and gps.is_valid():
-            lines.append("## GPS Information")
-            lines.append("")
-            lines.append(f"- **Coordinates**: {gps.latitude_decimal:.6f}, {gps.longitude_decimal:.6f}")
-            
-            if gps.altitude_meters:
-                lines.append(f"- **Altitude**: {gps.altitude_meters:.1f} meters")
-                if gps.altitude_reference:
-                    lines.append(f"  - Reference: {gps.altitude_reference}")
-            
-            lines.append(f"- **Coordinate System**: {gps.coordinate_system}")
-            
-            if gps.gps_accuracy:
-                lines.append(f"- **GPS Accuracy**: {gps.gps_accuracy:.1f}")
-            
-            if gps.gps_timestamp:
-                lines.append(f"- **GPS Timestamp**: {gps.gps_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            lines.append("")
+        try:
+            slash = framerate.find('/') if isinstance(framerate, str) else -1
+            if slash == -1:
+                framerate_float = float(framerate)
+            else:
+                # Parse fractional framerate like "30/1"
+                den = float(framerate[slash + 1:])
+                if not den:
+                    return f"- **Frame Rate**: {framerate}\n"
+                framerate_float = float(framerate[:slash]) / den
+            return f"- **Frame Rate**: {framerate_float:.1f} fps\n"
+        except ValueError:
+            return f"- **Frame Rate**: {framerate}\n"
+    
+    def _format_gps_section(self, gps: Optional[GPSData]) -> str:
+        """Format the GPS information, or nothing without valid coordinates."""
+        if not (gps and gps.is_valid()):
+            return ""
         
-        # Mission information
-        if mission and mission.is_classified():
-            lines.append("## Mission Information")
-            lines.append("")
-            lines.append(f"- **Mission Type**: {mission.mission_type.value.title()}")
-            lines.append(f"- **Mission Code**: {mission.get_mission_code()}")
-            
-            if mission.bay_designation:
-                lines.append(f"- **Bay**: {mission.bay_designation}")
-            
-            if mission.flight_purpose:
-                lines.append(f"- **Purpose**: {mission.flight_purpose}")
-            
-            if mission.pilot_name:
-                lines.append(f"- **Pilot**: {mission.pilot_name}")
-            
-            if mission.weather_conditions:
-                lines.append(f"- **Weather**: {mission.weather_conditions}")
-            
-            if mission.classification_confidence > 0:
-                lines.append(f"- **Classification Confidence**: {mission.classification_confidence:.1%}")
-                if mission.classification_method:
-                    lines.append(f"- **Classification Method**: {mission.classification_method}")
-            
-            if mission.mission_notes:
-                lines.append(f"- **Notes**: {mission.mission_notes}")
-            
-            lines.append("")
+        altitude = ""
+        if gps.altitude_meters:
+            altitude = f"- **Altitude**: {gps.altitude_meters:.1f} meters\n"
+            if gps.altitude_reference:
+                altitude += f"  - Reference: {gps.altitude_reference}\n"
         
-        # DJI-specific metadata (if any interesting fields found)
-        if result.dji_metadata and len(result.dji_metadata) > 0:
-            lines.append("## DJI Metadata")
-            lines.append("")
-            
-            # Add first few DJI metadata fields (avoid overwhelming output)
-            dji_count = 0
-            for key, value in result.dji_metadata.items():
-                if dji_count >= 10:  # Limit to first 10 entries
-                    lines.append(f"- *(and {len(result.dji_metadata) - 10} more fields...)*")
-                    break
-                lines.append(f"- **{key}**: {value}")
-                dji_count += 1
-            
-            lines.append("")
+        accuracy = f"- **GPS Accuracy**: {gps.gps_accuracy:.1f}\n" if gps.gps_accuracy else ""
+        timestamp = ""
+        if gps.gps_timestamp:
+            timestamp = f"- **GPS Timestamp**: {gps.gps_timestamp.strftime(TIMESTAMP_FORMAT)}\n"
         
-        # Processing information
-        lines.append("## Processing Information")
-        lines.append("")
-        lines.append(f"- **Extraction Success**: {'✅ Yes' if result.extraction_success else '❌ No'}")
+        return (
+            "## GPS Information\n"
+            "\n"
+            f"- **Coordinates**: {gps.latitude_decimal:.6f}, {gps.longitude_decimal:.6f}\n"
+            f"{altitude}"
+            f"- **Coordinate System**: {gps.coordinate_system}\n"
+            f"{accuracy}{timestamp}"
+            "\n"
+        )
+    
+    def _format_mission_section(self, mission: Optional[MissionData]) -> str:
+        """Format the mission information, or nothing for unclassified videos."""
+        if not (mission and mission.is_classified()):
+            return ""
         
-        if result.processing_duration:
-            lines.append(f"- **Processing Time**: {result.processing_duration.total_seconds():.2f} seconds")
+        bay = f"- **Bay**: {mission.bay_designation}\n" if mission.bay_designation else ""
+        purpose = f"- **Purpose**: {mission.flight_purpose}\n" if mission.flight_purpose else ""
+        pilot = f"- **Pilot**: {mission.pilot_name}\n" if mission.pilot_name else ""
+        weather = f"- **Weather**: {mission.weather_conditions}\n" if mission.weather_conditions else ""
+        
+        confidence = ""
+        if mission.classification_confidence > 0:
+            confidence = f"- **Classification Confidence**: {mission.classification_confidence:.1%}\n"
+            if mission.classification_method:
+                confidence += f"- **Classification Method**: {mission.classification_method}\n"
         
-        if result.extraction_errors:
-            lines.append(f"- **Errors**: {len(result.extraction_errors)}")
-            for error in result.extraction_errors[:3]:  # Show first 3 errors
-                lines.append(f"  - {error}")
-            if len(result.extraction_errors) > 3:
-                lines.append(f"  - *(and {len(result.extraction_errors) - 3} more...)*")
+        notes = f"- **Notes**: {mission.mission_notes}\n" if mission.mission_notes else ""
         
-        if result.extraction_warnings:
-            lines.append(f"- **Warnings**: {len(result.extraction_warnings)}")
-            for warning in result.extraction_warnings[:3]:  # Show first 3 warnings
-                lines.append(f"  - {warning}")
-            if len(result.extraction_warnings) > 3:
-                lines.append(f"  - *(and {len(result.extraction_warnings) - 3} more...)*")
+        return (
+            "## Mission Information\n"
+            "\n"
+            f"- **Mission Type**: {mission.mission_type.value.title()}\n"
+            f"- **Mission Code**: {mission.get_mission_code()}\n"
+            f"{bay}{purpose}{pilot}{weather}{confidence}{notes}"
+            "\n"
+        )
+    
+    def _format_dji_section(self, dji_metadata: Dict[str, Any]) -> str:
+        """Format the first DJI metadata fields, or nothing if there are none."""
+        if not dji_metadata:
+            return ""
         
-        lines.append("")
+        # Add first few DJI metadata fields (avoid overwhelming output)
+        fields = "".join(f"- **{key}**: {value}\n" for key, value in islice(dji_metadata.items(), 10))
+        more = ""
+        if len(dji_metadata) > 10:  # Limit to first 10 entries
+            more = f"- *(and {len(dji_metadata) - 10} more fields...)*\n"
         
-        # Thumbnail link (placeholder for Phase 2)
-        lines.append("## Media")
-        lines.append("")
-        lines.append("### Thumbnail")
-        lines.append("")
-        lines.append(f"![{video.filename} thumbnail](thumbnails/{video.filename}_thumbnail.jpg)")
-        lines.append("")
-        lines.append("*Thumbnail will be generated in Phase 2 implementation*")
-        lines.append("")
+        return f"## DJI Metadata\n\n{fields}{more}\n"
+    
+    def _format_processing_section(self, result: VideoAnalysisResult) -> str:
+        """Format the extraction status, timing, errors and warnings."""
+        processing_time = ""
+        if result.processing_duration:
+            processing_time = f"- **Processing Time**: {result.processing_duration.total_seconds():.2f} seconds\n"
         
-        # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*Generated by drone_metadata_automation on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+        return (
+            "## Processing Information\n"
+            "\n"
+            f"- **Extraction Success**: {'✅ Yes' if result.extraction_success else '❌ No'}\n"
+            f"{processing_time}"
+            f"{self._format_issue_list('Errors', result.extraction_errors)}"
+            f"{self._format_issue_list('Warnings', result.extraction_warnings)}"
+            "\n"
+        )
+    
+    def _format_issue_list(self, label: str, issues: List[str]) -> str:
+        """Format a count of errors or warnings followed by the first three of them."""
+        if not issues:
+            return ""
         
-        return "\n".join(lines)
+        more = f"  - *(and {len(issues) - 3} more...)*\n" if len(issues) > 3 else ""
+        return (
+            f"- **{label}**: {len(issues)}\n"
+            + "".join(f"  - {issue}\n" for issue in issues[:3])  # Show first 3
+            + more
+        )
+    
+    def _format_media_section(self, video: VideoMetadata) -> str:
+        """Format the thumbnail link (placeholder for Phase 2)."""
+        return (
+            "## Media\n"
+            "\n"
+            "### Thumbnail\n"
+            "\n"
+            f"![{video.filename} thumbnail](thumbnails/{video.filename}_thumbnail.jpg)\n"
+            "\n"
+            "*Thumbnail will be generated in Phase 2 implementation*\n"
+            "\n"
+        )
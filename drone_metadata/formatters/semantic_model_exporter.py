@@ -7,14 +7,159 @@ normalized CSV data tables in the semantic model format used by
 the Pilot04_Field_Test_April_25 example.
 """
 
+import hashlib
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any
-import csv
+from typing import Iterable, List, Dict, Any, Sequence, Set, Tuple
 
 from .base_formatter import BaseFormatter, FormatterError
 from ..models import VideoAnalysisResult, VideoProcessingBatch
 
 
+# Output of csv.writer's default (excel) dialect: fields containing a delimiter,
+# quote or line break are quoted, and rows end with CRLF
+CSV_LINE_TERMINATOR = "\r\n"
+_CSV_SPECIAL_CHARS = (',', '"', '\r', '\n')
+
+# Semantic model tables, in generation order
+FACTS_TABLE = "flight_facts.csv"
+DIMENSION_TABLES = (
+    "altitude_dimension.csv",
+    "bay_dimension.csv",
+    "resolution_dimension.csv",
+    "speed_dimension.csv",
+    "distance_dimension.csv",
+    "angle_dimension.csv",
+)
+
+# Category boundaries of dimension values; a value equal to a boundary falls in the upper category
+ALTITUDE_THRESHOLDS = (50, 150)  # metres
+ALTITUDE_CATEGORIES = ("low", "medium", "high")
+RESOLUTION_WIDTH_THRESHOLDS = (1280, 1920, 3840)  # pixels
+RESOLUTION_CATEGORIES = ("Standard", "HD", "Full HD", "4K")
+SPEED_THRESHOLDS = (3, 6, 10, 15)  # mph, inclusive upper bounds
+SPEED_CATEGORIES = (
+    ("very_slow", "detailed_inspection"),
+    ("slow", "close_inspection"),
+    ("moderate", "general_inspection"),
+    ("fast", "survey_mapping"),
+    ("very_fast", "transit"),
+)
+DISTANCE_THRESHOLDS = (0.1, 0.3, 1.0, 3.0)  # miles, inclusive upper bounds
+DISTANCE_CATEGORIES = (
+    ("very_short", "hover_inspection"),
+    ("short", "focused_inspection"),
+    ("medium", "area_inspection"),
+    ("long", "perimeter_survey"),
+    ("very_long", "comprehensive_survey"),
+)
+
+# Flight estimates by mission type: (speed cap in mph, speed numerator in mph*s, average mph for distance)
+_MISSION_FLIGHT_PROFILES: Dict[str, Tuple[float, float, float]] = {
+    # Slow inspection speeds (1-5 mph), short distances at ~3 mph average
+    "box": (5.0, 120.0, 3.0),
+    "safety": (5.0, 120.0, 3.0),
+    "angles": (5.0, 120.0, 3.0),
+    # Moderate survey speeds (5-15 mph), longer distances at ~8 mph average
+    "overview": (15.0, 300.0, 8.0),
+    "survey": (15.0, 300.0, 8.0),
+}
+_DEFAULT_FLIGHT_PROFILE = (10.0, 180.0, 5.0)  # ~5 mph average
+
+# Typical camera angles by mission type, used until gimbal angles are found in DJI metadata
+_MISSION_CAMERA_ANGLES: Dict[str, Tuple[float, ...]] = {
+    "box": (-30.0, -45.0, -60.0),  # Downward angles for inspection
+    "safety": (-30.0, -45.0, -60.0),
+    "angles": (-15.0, -30.0, -45.0, -60.0, -75.0),  # Multiple angles
+    "overview": (-20.0, -30.0),  # Moderate downward angles
+    "survey": (-20.0, -30.0),
+}
+
+# DJI metadata keys already checked for pitch/tilt, keyed by the raw key. The
+# key set is small and repeats across videos, so each key is lower-cased once.
+_angle_key_matches: Dict[str, bool] = {}
+
+# Fact rows joined and encoded per write chunk, so the table is never held as one string
+FACT_ROWS_PER_CHUNK = 1024
+
+# Suffix of the sidecar file recording the digest of the values a dimension table was written
+# from, followed by the table's size and modification time
+DIGEST_SUFFIX = ".hash"
+
+# Version of the dimension table layout and categories, part of every digest. Bump it
+# whenever the written tables change for the same values, so older tables are replaced.
+DIGEST_FORMAT_VERSION = 1
+
+# Suffix of the temporary file a table is written to before being moved into place
+TEMP_SUFFIX = ".tmp"
+
+# Zero-padded row numbers ("001", "002", ...) shared by every table's ids, extended on demand
+_row_numbers: List[str] = []
+
+
+def _row_ids(prefix: str, count: int) -> List[str]:
+    """Return the ids prefix001 .. prefixNNN for a table's rows."""
+    global _row_numbers
+    numbers = _row_numbers
+    if len(numbers) < count:
+        # Replace rather than extend, so concurrent table generation never sees a partial list
+        numbers = numbers + [f"{i:03d}" for i in range(len(numbers) + 1, count + 1)]
+        _row_numbers = numbers
+    return [prefix + number for number in islice(numbers, count)]
+
+
+def _table_digest(headers: List[str], values: List[Any]) -> str:
+    """Digest of a dimension table's format version, headers and sorted values, which determine its content."""
+    return hashlib.blake2b(
+        repr((DIGEST_FORMAT_VERSION, headers, values)).encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+
+def _quote_csv_field(value: Any) -> str:
+    """Format a single field as csv.writer would."""
+    if value is None:
+        return ""
+    text = value if isinstance(value, str) else str(value)
+    if any(char in text for char in _CSV_SPECIAL_CHARS):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_csv_rows(rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Format multi-field rows as CSV text identical to csv.writer's output.
+    
+    Each row is joined directly and only re-formatted field by field when
+    the joined line shows that some field needs quoting.
+    """
+    lines = []
+    for row in rows:
+        line = ",".join(["" if value is None else str(value) for value in row])
+        if line.count(",") != len(row) - 1 or '"' in line or '\r' in line or '\n' in line:
+            line = ",".join(map(_quote_csv_field, row))
+        lines.append(line)
+    
+    if not lines:
+        return ""
+    return CSV_LINE_TERMINATOR.join(lines) + CSV_LINE_TERMINATOR
+
+
+@dataclass
+class _SemanticModelValues:
+    """Fact rows and distinct dimension values collected in one pass over the results."""
+    fact_lines: List[str] = field(default_factory=list)  # formatted flight_facts.csv rows
+    altitudes: Set[float] = field(default_factory=set)
+    bays: Set[str] = field(default_factory=set)
+    resolutions: Set[Tuple[int, int]] = field(default_factory=set)
+    speeds: Set[float] = field(default_factory=set)
+    distances: Set[float] = field(default_factory=set)
+    angles: Set[float] = field(default_factory=set)
+
+
 class SemanticModelExporter(BaseFormatter):
     """
     Formatter for generating normalized CSV tables from video metadata.
@@ -49,19 +194,10 @@ class SemanticModelExporter(BaseFormatter):
         video_name = result.video_metadata.filename
         self._log_processing_start("semantic model export", video_name)
         
-        output_paths = []
-        
         try:
-            # Generate flight facts entry
-            facts_path = self._generate_flight_facts([result])
-            if facts_path:
-                output_paths.append(facts_path)
-            
-            # Generate dimension tables (placeholder for Phase 1)
-            dimension_paths = self._generate_dimension_tables([result])
-            output_paths.extend(dimension_paths)
+            output_paths = self._export_tables([result], parallel=False)
             
-            self._log_processing_complete("semantic model export", video_name, Path(self.config.output_directory))
+            self._log_processing_complete("semantic model export", video_name, self._output_dir)
             return output_paths
             
         except Exception as e:
@@ -83,40 +219,229 @@ class SemanticModelExporter(BaseFormatter):
             return []
         
         try:
-            output_paths = []
-            
-            # Generate consolidated flight facts table
-            facts_path = self._generate_flight_facts(batch.video_results)
-            if facts_path:
-                output_paths.append(facts_path)
-            
-            # Generate dimension tables
-            dimension_paths = self._generate_dimension_tables(batch.video_results)
-            output_paths.extend(dimension_paths)
-            
-            return output_paths
+            return self._export_tables(batch.video_results, parallel=True)
             
         except Exception as e:
             error_msg = f"Failed to export semantic model for batch: {str(e)}"
             self._log_processing_error("semantic model export", "batch", error_msg)
             raise FormatterError(error_msg)
     
-    def _generate_flight_facts(self, results: List[VideoAnalysisResult]) -> Path:
+    def _export_tables(self, results: List[VideoAnalysisResult], parallel: bool) -> List[Path]:
         """
-        Generate the main flight_facts.csv table.
+        Generate the flight facts and dimension tables for a set of results.
         
         Args:
             results: List of video analysis results
+            parallel: Generate the tables concurrently on a thread pool
             
         Returns:
-            Path to generated flight_facts.csv file
+            List of paths to generated CSV files
         """
-        # Use first result to determine organized path for batch files
+        values = self._collect_values(results)
+        
+        # Resolve every table path and list their directories once, up front
+        table_paths = self._get_table_paths(results)
+        existing_files = self._list_existing_files(table_paths.values())
+        
+        tables = [
+            (self._generate_flight_facts, FACTS_TABLE, values.fact_lines),
+            (self._generate_altitude_dimension, "altitude_dimension.csv", values.altitudes),
+            (self._generate_bay_dimension, "bay_dimension.csv", values.bays),
+            (self._generate_resolution_dimension, "resolution_dimension.csv", values.resolutions),
+            # Phase 2 additions: speed, distance, and angle dimensions
+            (self._generate_speed_dimension, "speed_dimension.csv", values.speeds),
+            (self._generate_distance_dimension, "distance_dimension.csv", values.distances),
+            (self._generate_angle_dimension, "angle_dimension.csv", values.angles),
+        ]
+        
+        def generate(table) -> Path:
+            generator, filename, table_values = table
+            return generator(table_paths[filename], existing_files, table_values)
+        
+        # The tables are independent once the values are collected, so a batch overlaps their writes
+        if parallel:
+            with ThreadPoolExecutor(max_workers=self._get_io_workers(len(tables))) as executor:
+                output_paths = list(executor.map(generate, tables))
+        else:
+            output_paths = [generate(table) for table in tables]
+        
+        return [path for path in output_paths if path]
+    
+    def _get_table_paths(self, results: List[VideoAnalysisResult]) -> Dict[str, Path]:
+        """Get the output path of every table; the first result determines the organized location."""
         first_result = results[0] if results else None
-        facts_path = self._get_output_path("flight_facts.csv", first_result, '.csv')
+        return {
+            filename: self._get_output_path(filename, first_result, '.csv')
+            for filename in (FACTS_TABLE, *DIMENSION_TABLES)
+        }
+    
+    @staticmethod
+    def _list_existing_files(paths: Iterable[Path]) -> Dict[Path, Set[str]]:
+        """List the file names already present in each of the given paths' directories."""
+        existing_files = {}
+        for directory in {path.parent for path in paths}:
+            try:
+                with os.scandir(directory) as entries:
+                    existing_files[directory] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing_files[directory] = set()
+        return existing_files
+    
+    def _is_existing_output(self, path: Path, existing_files: Dict[Path, Set[str]]) -> bool:
+        """Check whether an existing output file should be kept, without a stat for absent files."""
+        return path.name in existing_files[path.parent] and self._check_file_exists(path)
+    
+    def _is_unchanged_output(self, path: Path, existing_files: Dict[Path, Set[str]], digest: str) -> bool:
+        """
+        Check whether a dimension table was already written from values with the given digest.
+        
+        The sidecar also records the table's size and modification time, so an
+        edited or damaged table no longer matches and is rewritten.
+        """
+        names = existing_files[path.parent]
+        digest_name = path.name + DIGEST_SUFFIX
+        if path.name not in names or digest_name not in names:
+            return False
+        
+        try:
+            recorded = path.with_name(digest_name).read_text(encoding='utf-8')
+            stat = path.stat()
+        except OSError:
+            return False
+        unchanged = recorded == f"{digest} {stat.st_size} {stat.st_mtime_ns}"
+        if unchanged:
+            self.logger.info(f"Dimension values unchanged, keeping existing file: {path}")
+        return unchanged
+    
+    def _write_dimension_table(self, path: Path, headers: List[str], rows: List[List[Any]], digest: str) -> None:
+        """Write a dimension table followed by the sidecar recording its digest, size and modification time."""
+        self._replace_text_file(path, _format_csv_rows([headers, *rows]))
+        stat = path.stat()
+        self._replace_text_file(
+            path.with_name(path.name + DIGEST_SUFFIX), f"{digest} {stat.st_size} {stat.st_mtime_ns}"
+        )
+    
+    def _replace_text_file(self, path: Path, content: str) -> None:
+        """Write a text document as UTF-8 through _replace_file_chunks."""
+        self._replace_file_chunks(path, [content.encode('utf-8')])
+    
+    def _replace_file_chunks(self, path: Path, chunks: Iterable[bytes]) -> None:
+        """
+        Write a file through a temporary sibling and atomically move it into place.
+        
+        An interrupted export then never leaves a truncated table behind that a
+        later run would keep as an existing output.
+        """
+        tmp_path = path.with_name(path.name + TEMP_SUFFIX)
+        try:
+            self._write_byte_chunks(tmp_path, chunks)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _collect_values(self, results: List[VideoAnalysisResult]) -> _SemanticModelValues:
+        """
+        Collect the flight fact rows and every dimension's distinct values.
+        
+        All tables are derived from a single pass over the results, so each
+        result's metadata objects are looked up once rather than once per table.
         
+        Args:
+            results: List of video analysis results
+            
+        Returns:
+            Fact rows and dimension value sets for the semantic model tables
+        """
+        values = _SemanticModelValues()
+        fact_lines = values.fact_lines
+        altitudes = values.altitudes
+        bays = values.bays
+        resolutions = values.resolutions
+        speeds = values.speeds
+        distances = values.distances
+        angles = values.angles
+        
+        # Formatted extraction times by object id; results from one ingestion run often share one
+        timestamps: Dict[int, str] = {}
+        
+        for flight_id, result in zip(_row_ids("flight_", len(results)), results):
+            video = result.video_metadata
+            specs = result.technical_specs
+            gps = result.gps_data
+            mission = result.mission_data
+            gps_valid = gps is not None and gps.is_valid()
+            mission_type = mission.mission_type.value if mission else None
+            
+            # Format the fact row directly; only the free-text fields can need quoting
+            latitude = gps.latitude_decimal if gps_valid else ""
+            longitude = gps.longitude_decimal if gps_valid else ""
+            altitude = "" if gps is None or gps.altitude_meters is None else gps.altitude_meters
+            bay = _quote_csv_field(mission.bay_designation) if mission else ""
+            extraction_time = video.extraction_time
+            timestamp = timestamps.get(id(extraction_time))
+            if timestamp is None:
+                timestamp = timestamps[id(extraction_time)] = extraction_time.isoformat()
+            fact_lines.append(
+                f"{flight_id},{_quote_csv_field(video.filename)},{video.duration_seconds or 0},"
+                f"{round(video.filesize_mb, 2)},{specs.width or 0},{specs.height or 0},"
+                f"{_quote_csv_field(specs.video_codec or 'unknown')},{latitude},{longitude},{altitude},"
+                f"{mission_type or 'unknown'},{bay},{timestamp},"
+                f"{result.extraction_success}{CSV_LINE_TERMINATOR}"
+            )
+            
+            # Altitude, bay and resolution dimensions
+            if gps and gps.altitude_meters is not None:
+                altitudes.add(gps.altitude_meters)
+            if mission and mission.bay_designation:
+                bays.add(mission.bay_designation)
+            if specs.width and specs.height:
+                resolutions.add((specs.width, specs.height))
+            
+            # Speed and distance dimensions, estimated from duration and mission type
+            duration = video.duration_seconds
+            if mission and duration and duration > 0:
+                speed_cap, speed_numerator, average_mph = _MISSION_FLIGHT_PROFILES.get(
+                    mission_type, _DEFAULT_FLIGHT_PROFILE
+                )
+                speeds.add(round(min(speed_cap, speed_numerator / duration), 1))
+                distances.add(round(duration / 3600.0 * average_mph, 2))
+            
+            # Angle dimension: gimbal angles from DJI metadata
+            if result.dji_metadata:
+                for key, value in result.dji_metadata.items():
+                    is_angle_key = _angle_key_matches.get(key)
+                    if is_angle_key is None:
+                        lowered = key.lower()
+                        is_angle_key = _angle_key_matches[key] = "pitch" in lowered or "tilt" in lowered
+                    if is_angle_key:
+                        try:
+                            angle_value = float(value)
+                            angles.add(round(angle_value, 1))
+                        except (ValueError, TypeError):
+                            continue
+            
+            # Estimate based on mission type if no DJI data
+            if mission and not angles:
+                angles.update(_MISSION_CAMERA_ANGLES.get(mission_type, ()))
+        
+        return values
+    
+    def _generate_flight_facts(self, facts_path: Path, existing_files: Dict[Path, Set[str]],
+                               fact_lines: List[str]) -> Path:
+        """
+        Generate the main flight_facts.csv table.
+        
+        Args:
+            facts_path: Output path of the table
+            existing_files: Existing file names by directory, from _list_existing_files
+            fact_lines: Formatted rows for the results, as built by _collect_values
+            
+        Returns:
+            Path to generated flight_facts.csv file
+        """
         # Check if file exists and handle accordingly
-        if self._check_file_exists(facts_path):
+        if self._is_existing_output(facts_path, existing_files):
             return facts_path
         
         # Define CSV headers based on Pilot04 format
@@ -137,337 +462,169 @@ class SemanticModelExporter(BaseFormatter):
             "processing_success"
         ]
         
-        # Write CSV data
-        with open(facts_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(headers)
-            
-            for i, result in enumerate(results, 1):
-                video = result.video_metadata
-                specs = result.technical_specs
-                gps = result.gps_data
-                mission = result.mission_data
-                
-                row = [
-                    f"flight_{i:03d}",  # flight_id
-                    video.filename,
-                    video.duration_seconds or 0,
-                    round(video.filesize_mb, 2),
-                    specs.width or 0,
-                    specs.height or 0,
-                    specs.video_codec or "unknown",
-                    gps.latitude_decimal if gps and gps.is_valid() else None,
-                    gps.longitude_decimal if gps and gps.is_valid() else None,
-                    gps.altitude_meters if gps else None,
-                    mission.mission_type.value if mission else "unknown",
-                    mission.bay_designation if mission else None,
-                    video.extraction_time.isoformat(),
-                    result.extraction_success
-                ]
-                
-                writer.writerow(row)
+        # Write CSV data; the rows are mostly numbers and were formatted without the csv module
+        row_chunks = (
+            "".join(fact_lines[start:start + FACT_ROWS_PER_CHUNK]).encode('utf-8')
+            for start in range(0, len(fact_lines), FACT_ROWS_PER_CHUNK)
+        )
+        self._replace_file_chunks(facts_path, chain([_format_csv_rows([headers]).encode('utf-8')], row_chunks))
         
         return facts_path
     
-    def _generate_dimension_tables(self, results: List[VideoAnalysisResult]) -> List[Path]:
-        """
-        Generate dimension tables for the semantic model.
-        
-        Args:
-            results: List of video analysis results
-            
-        Returns:
-            List of paths to generated dimension CSV files
-        """
-        dimension_paths = []
-        
-        # Altitude dimension
-        altitude_path = self._generate_altitude_dimension(results)
-        if altitude_path:
-            dimension_paths.append(altitude_path)
-        
-        # Bay dimension  
-        bay_path = self._generate_bay_dimension(results)
-        if bay_path:
-            dimension_paths.append(bay_path)
-        
-        # Resolution dimension
-        resolution_path = self._generate_resolution_dimension(results)
-        if resolution_path:
-            dimension_paths.append(resolution_path)
-        
-        # Phase 2 additions: speed, distance, and angle dimensions
-        speed_path = self._generate_speed_dimension(results)
-        if speed_path:
-            dimension_paths.append(speed_path)
-            
-        distance_path = self._generate_distance_dimension(results)
-        if distance_path:
-            dimension_paths.append(distance_path)
-            
-        angle_path = self._generate_angle_dimension(results)
-        if angle_path:
-            dimension_paths.append(angle_path)
-        
-        return dimension_paths
-    
-    def _generate_altitude_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_altitude_dimension(self, altitude_path: Path, existing_files: Dict[Path, Set[str]],
+                                     altitudes: Set[float]) -> Path:
         """Generate altitude_dimension.csv table."""
-        first_result = results[0] if results else None
-        altitude_path = self._get_output_path("altitude_dimension.csv", first_result, '.csv')
+        sorted_altitudes = sorted(altitudes)
+        
+        headers = ["altitude_id", "altitude_meters", "altitude_category"]
+        digest = _table_digest(headers, sorted_altitudes)
         
-        if self._check_file_exists(altitude_path):
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(altitude_path, existing_files, digest)
+                or self._is_existing_output(altitude_path, existing_files)):
             return altitude_path
         
-        # Extract unique altitude values
-        altitudes = set()
-        for result in results:
-            if result.gps_data and result.gps_data.altitude_meters is not None:
-                altitudes.add(result.gps_data.altitude_meters)
+        rows = [
+            [alt_id, alt, ALTITUDE_CATEGORIES[bisect_right(ALTITUDE_THRESHOLDS, alt)]]
+            for alt_id, alt in zip(_row_ids("alt_", len(sorted_altitudes)), sorted_altitudes)
+        ]
         
         # Write altitude dimension table
-        with open(altitude_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["altitude_id", "altitude_meters", "altitude_category"])
-            
-            for i, alt in enumerate(sorted(altitudes), 1):
-                category = "low" if alt < 50 else "medium" if alt < 150 else "high"
-                writer.writerow([f"alt_{i:03d}", alt, category])
+        self._write_dimension_table(altitude_path, headers, rows, digest)
         
         return altitude_path
     
-    def _generate_bay_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_bay_dimension(self, bay_path: Path, existing_files: Dict[Path, Set[str]],
+                                bays: Set[str]) -> Path:
         """Generate bay_dimension.csv table."""
-        first_result = results[0] if results else None
-        bay_path = self._get_output_path("bay_dimension.csv", first_result, '.csv')
+        headers = ["bay_id", "bay_name", "bay_type"]
+        sorted_bays = sorted(bays)
+        digest = _table_digest(headers, sorted_bays)
         
-        if self._check_file_exists(bay_path):
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(bay_path, existing_files, digest)
+                or self._is_existing_output(bay_path, existing_files)):
             return bay_path
         
-        # Extract unique bay designations
-        bays = set()
-        for result in results:
-            if result.mission_data and result.mission_data.bay_designation:
-                bays.add(result.mission_data.bay_designation)
+        rows = [
+            [bay_id, bay, "inspection_bay"]
+            for bay_id, bay in zip(_row_ids("bay_", len(sorted_bays)), sorted_bays)
+        ]
         
         # Write bay dimension table
-        with open(bay_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["bay_id", "bay_name", "bay_type"])
-            
-            for i, bay in enumerate(sorted(bays), 1):
-                writer.writerow([f"bay_{i:03d}", bay, "inspection_bay"])
+        self._write_dimension_table(bay_path, headers, rows, digest)
         
         return bay_path
     
-    def _generate_resolution_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_resolution_dimension(self, resolution_path: Path, existing_files: Dict[Path, Set[str]],
+                                       resolutions: Set[Tuple[int, int]]) -> Path:
         """Generate resolution_dimension.csv table (Phase 1 addition)."""
-        first_result = results[0] if results else None
-        resolution_path = self._get_output_path("resolution_dimension.csv", first_result, '.csv')
+        headers = ["resolution_id", "width", "height", "resolution_name", "quality_category"]
+        sorted_resolutions = sorted(resolutions)
+        digest = _table_digest(headers, sorted_resolutions)
         
-        if self._check_file_exists(resolution_path):
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(resolution_path, existing_files, digest)
+                or self._is_existing_output(resolution_path, existing_files)):
             return resolution_path
         
-        # Extract unique resolutions
-        resolutions = set()
-        for result in results:
-            specs = result.technical_specs
-            if specs.width and specs.height:
-                resolutions.add((specs.width, specs.height))
+        rows = []
+        for res_id, (width, height) in zip(_row_ids("res_", len(sorted_resolutions)), sorted_resolutions):
+            quality_category = RESOLUTION_CATEGORIES[bisect_right(RESOLUTION_WIDTH_THRESHOLDS, width)]
+            rows.append([res_id, width, height, f"{width}x{height}", quality_category])
         
         # Write resolution dimension table
-        with open(resolution_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["resolution_id", "width", "height", "resolution_name", "quality_category"])
-            
-            for i, (width, height) in enumerate(sorted(resolutions), 1):
-                resolution_name = f"{width}x{height}"
-                if width >= 3840:
-                    quality_category = "4K"
-                elif width >= 1920:
-                    quality_category = "Full HD"
-                elif width >= 1280:
-                    quality_category = "HD"
-                else:
-                    quality_category = "Standard"
-                
-                writer.writerow([f"res_{i:03d}", width, height, resolution_name, quality_category])
+        self._write_dimension_table(resolution_path, headers, rows, digest)
         
         return resolution_path
     
-    def _generate_speed_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_speed_dimension(self, speed_path: Path, existing_files: Dict[Path, Set[str]],
+                                  speeds: Set[float]) -> Path:
         """Generate speed_dimension.csv table (Phase 2 addition)."""
-        first_result = results[0] if results else None
-        speed_path = self._get_output_path("speed_dimension.csv", first_result, '.csv')
-        
-        if self._check_file_exists(speed_path):
-            return speed_path
-        
-        # Calculate estimated speeds from video duration and estimated distance
-        speeds = set()
-        for result in results:
-            duration = result.video_metadata.duration_seconds
-            if duration and duration > 0:
-                # Estimate based on mission type and duration
-                if result.mission_data:
-                    mission_type = result.mission_data.mission_type.value
-                    if mission_type in ["box", "safety", "angles"]:
-                        # Slow inspection speeds (1-5 mph)
-                        estimated_speed = min(5.0, 120.0 / duration)  # Conservative estimate
-                    elif mission_type in ["overview", "survey"]:
-                        # Moderate survey speeds (5-15 mph)
-                        estimated_speed = min(15.0, 300.0 / duration)
-                    else:
-                        # Default estimation
-                        estimated_speed = min(10.0, 180.0 / duration)
-                    
-                    speeds.add(round(estimated_speed, 1))
-        
         # Add some standard speed ranges if no specific data
         if not speeds:
             speeds = {2.0, 5.0, 8.0, 12.0, 15.0}
         
+        headers = ["speed_id", "speed_mph", "speed_category", "typical_use"]
+        sorted_speeds = sorted(speeds)
+        digest = _table_digest(headers, sorted_speeds)
+        
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(speed_path, existing_files, digest)
+                or self._is_existing_output(speed_path, existing_files)):
+            return speed_path
+        
+        rows = [
+            [spd_id, speed, *SPEED_CATEGORIES[bisect_left(SPEED_THRESHOLDS, speed)]]
+            for spd_id, speed in zip(_row_ids("spd_", len(sorted_speeds)), sorted_speeds)
+        ]
+        
         # Write speed dimension table
-        with open(speed_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["speed_id", "speed_mph", "speed_category", "typical_use"])
-            
-            for i, speed in enumerate(sorted(speeds), 1):
-                if speed <= 3:
-                    category = "very_slow"
-                    use = "detailed_inspection"
-                elif speed <= 6:
-                    category = "slow"
-                    use = "close_inspection"
-                elif speed <= 10:
-                    category = "moderate"
-                    use = "general_inspection"
-                elif speed <= 15:
-                    category = "fast"
-                    use = "survey_mapping"
-                else:
-                    category = "very_fast"
-                    use = "transit"
-                
-                writer.writerow([f"spd_{i:03d}", speed, category, use])
+        self._write_dimension_table(speed_path, headers, rows, digest)
         
         return speed_path
     
-    def _generate_distance_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_distance_dimension(self, distance_path: Path, existing_files: Dict[Path, Set[str]],
+                                     distances: Set[float]) -> Path:
         """Generate distance_dimension.csv table (Phase 2 addition)."""
-        first_result = results[0] if results else None
-        distance_path = self._get_output_path("distance_dimension.csv", first_result, '.csv')
-        
-        if self._check_file_exists(distance_path):
-            return distance_path
-        
-        # Calculate estimated distances from video duration and estimated speed
-        distances = set()
-        for result in results:
-            duration = result.video_metadata.duration_seconds
-            if duration and duration > 0:
-                duration_hours = duration / 3600.0
-                
-                # Estimate based on mission type
-                if result.mission_data:
-                    mission_type = result.mission_data.mission_type.value
-                    if mission_type in ["box", "safety", "angles"]:
-                        # Short distance inspections
-                        estimated_distance = duration_hours * 3.0  # ~3 mph average
-                    elif mission_type in ["overview", "survey"]:
-                        # Longer distance surveys
-                        estimated_distance = duration_hours * 8.0  # ~8 mph average
-                    else:
-                        # Default estimation
-                        estimated_distance = duration_hours * 5.0  # ~5 mph average
-                    
-                    distances.add(round(estimated_distance, 2))
-        
         # Add some standard distance ranges if no specific data
         if not distances:
             distances = {0.05, 0.1, 0.25, 0.5, 1.0, 2.0}
         
+        headers = ["distance_id", "distance_miles", "distance_category", "typical_mission"]
+        sorted_distances = sorted(distances)
+        digest = _table_digest(headers, sorted_distances)
+        
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(distance_path, existing_files, digest)
+                or self._is_existing_output(distance_path, existing_files)):
+            return distance_path
+        
+        rows = [
+            [dst_id, distance, *DISTANCE_CATEGORIES[bisect_left(DISTANCE_THRESHOLDS, distance)]]
+            for dst_id, distance in zip(_row_ids("dst_", len(sorted_distances)), sorted_distances)
+        ]
+        
         # Write distance dimension table
-        with open(distance_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["distance_id", "distance_miles", "distance_category", "typical_mission"])
-            
-            for i, distance in enumerate(sorted(distances), 1):
-                if distance <= 0.1:
-                    category = "very_short"
-                    mission = "hover_inspection"
-                elif distance <= 0.3:
-                    category = "short"
-                    mission = "focused_inspection"
-                elif distance <= 1.0:
-                    category = "medium"
-                    mission = "area_inspection"
-                elif distance <= 3.0:
-                    category = "long"
-                    mission = "perimeter_survey"
-                else:
-                    category = "very_long"
-                    mission = "comprehensive_survey"
-                
-                writer.writerow([f"dst_{i:03d}", distance, category, mission])
+        self._write_dimension_table(distance_path, headers, rows, digest)
         
         return distance_path
     
-    def _generate_angle_dimension(self, results: List[VideoAnalysisResult]) -> Path:
+    def _generate_angle_dimension(self, angle_path: Path, existing_files: Dict[Path, Set[str]],
+                                  angles: Set[float]) -> Path:
         """Generate angle_dimension.csv table (Phase 2 addition)."""
-        first_result = results[0] if results else None
-        angle_path = self._get_output_path("angle_dimension.csv", first_result, '.csv')
+        # Add standard angles if no data found
+        if not angles:
+            angles = {0.0, -15.0, -30.0, -45.0, -60.0, -90.0}
         
-        if self._check_file_exists(angle_path):
+        headers = ["angle_id", "angle_degrees", "angle_category", "camera_orientation"]
+        sorted_angles = sorted(angles, reverse=True)  # Sort high to low
+        digest = _table_digest(headers, sorted_angles)
+        
+        # Skip tables already written from the same values, then existing files kept by configuration
+        if (self._is_unchanged_output(angle_path, existing_files, digest)
+                or self._is_existing_output(angle_path, existing_files)):
             return angle_path
         
-        # Extract camera angles from DJI metadata or estimate from mission type
-        angles = set()
-        for result in results:
-            # Try to extract gimbal angles from DJI metadata
-            if result.dji_metadata:
-                for key, value in result.dji_metadata.items():
-                    if "pitch" in key.lower() or "tilt" in key.lower():
-                        try:
-                            angle_value = float(value)
-                            angles.add(round(angle_value, 1))
-                        except (ValueError, TypeError):
-                            continue
+        rows = []
+        for ang_id, angle in zip(_row_ids("ang_", len(sorted_angles)), sorted_angles):
+            if angle >= 0:
+                category = "horizontal"
+                orientation = "forward_facing"
+            elif angle >= -30:
+                category = "slight_down"
+                orientation = "slight_downward"
+            elif angle >= -60:
+                category = "moderate_down"
+                orientation = "moderate_downward"
+            else:
+                category = "steep_down"
+                orientation = "steep_downward"
             
-            # Estimate based on mission type if no DJI data
-            if result.mission_data and not angles:
-                mission_type = result.mission_data.mission_type.value
-                if mission_type in ["box", "safety"]:
-                    angles.update([-30.0, -45.0, -60.0])  # Downward angles for inspection
-                elif mission_type == "angles":
-                    angles.update([-15.0, -30.0, -45.0, -60.0, -75.0])  # Multiple angles
-                elif mission_type in ["overview", "survey"]:
-                    angles.update([-20.0, -30.0])  # Moderate downward angles
-        
-        # Add standard angles if no data found
-        if not angles:
-            angles = {0.0, -15.0, -30.0, -45.0, -60.0, -90.0}
+            rows.append([ang_id, angle, category, orientation])
         
         # Write angle dimension table
-        with open(angle_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(["angle_id", "angle_degrees", "angle_category", "camera_orientation"])
-            
-            for i, angle in enumerate(sorted(angles, reverse=True), 1):  # Sort high to low
-                if angle >= 0:
-                    category = "horizontal"
-                    orientation = "forward_facing"
-                elif angle >= -30:
-                    category = "slight_down"
-                    orientation = "slight_downward"
-                elif angle >= -60:
-                    category = "moderate_down"
-                    orientation = "moderate_downward"
-                else:
-                    category = "steep_down"
-                    orientation = "steep_downward"
-                
-                writer.writerow([f"ang_{i:03d}", angle, category, orientation])
+        self._write_dimension_table(angle_path, headers, rows, digest)
         
         return angle_path
     
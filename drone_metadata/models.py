@@ -3,6 +3,7 @@ Core data models for drone metadata automation system.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
@@ -250,8 +251,9 @@ class QualityScore:
     coverage_quality: float
     equipment_performance: float
     
-    def get_grade(self) -> str:
-        """Convert score to letter grade."""
+    @cached_property
+    def grade(self) -> str:
+        """Letter grade for the overall score, computed once on first access."""
         if self.overall_score >= 0.9:
             return "A"
         elif self.overall_score >= 0.8:
@@ -262,6 +264,10 @@ class QualityScore:
             return "D"
         else:
             return "F"
+    
+    def get_grade(self) -> str:
+        """Convert score to letter grade."""
+        return self.grade
 
 
 @dataclass
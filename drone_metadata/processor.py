@@ -475,7 +475,7 @@ class DroneMetadataProcessor:
                 'videos': report.media_summary.total_videos,
                 'video_duration_minutes': report.media_summary.total_video_duration.total_seconds() / 60
             },
-            'quality_grade': report.quality_score.get_grade(),
+            'quality_grade': report.quality_score.grade,
             'anomalies_detected': len(report.anomalies),
             'processing_timestamp': report.timestamp_generated.isoformat()
         }
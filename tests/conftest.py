@@ -7,6 +7,11 @@ used across all test modules.
 
 import os
 from pathlib import Path
+from typing import Optional
+
+from drone_metadata.models import (
+    GPSData, MissionData, MissionType, TechnicalSpecs, VideoAnalysisResult, VideoMetadata
+)
 
 # Test data paths
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
@@ -27,4 +32,29 @@ EXPECTED_TEST_DATA = {
         'datetime(utc)', 'latitude', 'longitude', 'mileage(feet)', 
         'speed(mph)', 'battery_percent', 'height_above_takeoff(feet)'
     ]
-}
\ No newline at end of file
+}
+
+
+def make_result(filename: str, mission_type: Optional[MissionType] = None, bay: Optional[str] = None,
+                with_gps: bool = False) -> VideoAnalysisResult:
+    """
+    Create a minimal analysis result for formatter tests.
+    
+    Args:
+        filename: Video file name
+        mission_type: Mission classification; None leaves the result unclassified
+        bay: Bay designation of the mission (requires mission_type)
+        with_gps: Attach a valid GPS fix with an altitude of 40 m
+    """
+    return VideoAnalysisResult(
+        video_metadata=VideoMetadata(
+            filename=filename,
+            filepath=f"/videos/{filename}",
+            filesize_bytes=2_000_000,
+            filesize_mb=2.0,
+            duration_seconds=75.0,
+        ),
+        technical_specs=TechnicalSpecs(width=3840, height=2160, video_codec="h264"),
+        gps_data=GPSData(latitude_decimal=53.3, longitude_decimal=-6.2, altitude_meters=40.0) if with_gps else None,
+        mission_data=MissionData(mission_type=mission_type, bay_designation=bay) if mission_type else None,
+    )
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CLI catalog and report helpers.
+
+This module covers the HTML and Markdown catalog generators used by the
+generate-catalog command, and the Markdown and JSON serialization of
+flight reports.
+"""
+
+import json
+import unittest
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from drone_metadata import cli
+from drone_metadata.cli import _dump_report, _generate_html_catalog, _generate_markdown_catalog, _report_to_markdown
+from drone_metadata.models import (
+    FlightMetrics, FlightPath, FlightReport, GPSBounds, GPSPoint, InspectionClassification,
+    InspectionType, MediaSummary, QualityScore
+)
+
+
+def _make_report() -> FlightReport:
+    """Create a flight report with NumPy-typed metrics, as parsed from CSV telemetry."""
+    start = datetime(2025, 1, 1, 10, 0, 0)
+    point = GPSPoint(latitude=53.3, longitude=-6.2, altitude=120.0, timestamp=start)
+    return FlightReport(
+        flight_id="FLIGHT_001",
+        timestamp_generated=start,
+        bay_mapping=None,
+        flight_metrics=FlightMetrics(
+            max_altitude=np.float64(150.0), avg_altitude=np.float64(120.5), min_altitude=np.float64(0.0),
+            max_speed=np.float64(12.3), avg_speed=np.float64(6.1), total_distance=np.float64(0.75),
+            battery_start=np.float64(100.0), battery_end=np.float64(62.0), battery_consumed=np.float64(38.0),
+            gps_quality_avg=np.float64(14.2), max_satellites=np.int64(18), min_satellites=np.int64(11),
+        ),
+        flight_path=FlightPath(
+            coordinates=[point], total_distance=0.75,
+            bounding_box=GPSBounds(min_lat=53.3, max_lat=53.3, min_lon=-6.2, max_lon=-6.2),
+            centroid=point, is_circular=False, is_linear=True, circuit_completion=0.0,
+        ),
+        inspection_classification=InspectionClassification(inspection_type=InspectionType.DETAILED, confidence=0.9),
+        media_summary=MediaSummary(
+            total_photos=3, total_videos=1, total_video_duration=timedelta(minutes=2),
+            media_files=[], coverage_events=[],
+        ),
+        quality_score=QualityScore(
+            overall_score=np.float64(0.85), gps_quality=np.float64(0.9), battery_health=np.float64(0.95),
+            flight_stability=np.float64(0.4), coverage_quality=np.float64(0.8), equipment_performance=np.float64(0.9),
+        ),
+        processing_time=timedelta(seconds=1.5),
+    )
+
+
+class TestCatalogGeneration(unittest.TestCase):
+    """Test cases for catalog generation."""
+
+    def setUp(self):
+        """Create a small processed-output tree with metadata and thumbnails."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+
+        (self.base / 'box' / 'thumbnails').mkdir(parents=True)
+        (self.base / 'box' / 'DJI_0001.md').write_text('# DJI_0001')
+        (self.base / 'box' / 'thumbnails' / 'DJI_0001_thumbnail.jpg').write_bytes(b'')
+        (self.base / 'safety').mkdir()
+        (self.base / 'safety' / 'DJI_<b>&2_metadata.json').write_text('{}')
+
+        self.metadata_files = sorted(self.base.rglob('*.md')) + sorted(self.base.rglob('*_metadata.json'))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_html_catalog_escapes_file_names(self):
+        """Test that file names are HTML-escaped in the HTML catalog."""
+        html = _generate_html_catalog(self.metadata_files, self.base, True, 'mission')
+
+        self.assertNotIn('<b>', html)
+        self.assertIn('DJI_&lt;b&gt;&amp;2', html)
+        self.assertIn('Total Videos: 2', html)
+
+    def test_catalogs_link_thumbnails(self):
+        """Test that thumbnails are located and linked relative to the catalog root."""
+        thumbnail = str(Path('box') / 'thumbnails' / 'DJI_0001_thumbnail.jpg')
+
+        html = _generate_html_catalog(self.metadata_files, self.base, True, 'none')
+        markdown = _generate_markdown_catalog(self.metadata_files, self.base, True, 'date')
+
+        self.assertIn(f'src="{thumbnail}"', html)
+        self.assertIn(f'![Thumbnail]({thumbnail})', markdown)
+        self.assertIn('### 2. DJI_<b>&2', markdown)
+
+    def test_catalogs_without_thumbnails(self):
+        """Test that thumbnails are omitted when not requested."""
+        markdown = _generate_markdown_catalog(self.metadata_files, self.base, False, 'none')
+
+        self.assertNotIn('![Thumbnail]', markdown)
+        self.assertIn('## 🎥 All Videos', markdown)
+
+
+class TestReportFormatting(unittest.TestCase):
+    """Test cases for flight report serialization."""
+
+    def test_markdown_rates_numpy_scores(self):
+        """Test that NumPy-typed quality scores get rating badges."""
+        markdown = _report_to_markdown(_make_report())
+
+        self.assertIn('| GPS Quality | 0.90 | ✓ |', markdown)
+        self.assertIn('| Flight Stability | 0.40 | ⚠️ |', markdown)
+
+    def test_json_fallback_encoding(self):
+        """Test that the stdlib JSON fallback writes UTF-8 text and NumPy numbers."""
+        report = _make_report()
+        report.automated_annotations = {'site': 'Baile Átha Cliath', 'satellites': np.int64(18)}
+
+        with mock.patch.object(cli, 'ORJSON_AVAILABLE', False):
+            data = _dump_report(report)
+
+        self.assertIn('"site": "Baile Átha Cliath"'.encode('utf-8'), data)
+        self.assertIn(b'"satellites": 18', data)
+        self.assertIn(b'"timestamp_generated": "2025-01-01T10:00:00"', data)
+        self.assertEqual(json.loads(data)['flight_metrics']['avg_altitude_ft'], 120.5)
+
+    def test_json_fallback_writes_non_finite_floats_as_null(self):
+        """Test that the stdlib JSON fallback writes NaN and infinity as null, like orjson."""
+        data = {'altitude': float('nan'), 'speed': np.float32('inf'), 'angles': np.array([-30.0, np.nan])}
+
+        with mock.patch.object(cli, 'ORJSON_AVAILABLE', False):
+            encoded = cli._dump_json(data)
+
+        self.assertEqual(json.loads(encoded), {'altitude': None, 'speed': None, 'angles': [-30.0, None]})
+
+    def test_json_writes_integers_beyond_64_bits(self):
+        """Test that integers orjson cannot encode are still written."""
+        self.assertEqual(json.loads(cli._dump_json({'serial': 2 ** 70})), {'serial': 2 ** 70})
+
+    @unittest.skipUnless(cli.ORJSON_AVAILABLE, "orjson is not installed")
+    def test_json_encoders_match(self):
+        """Test that orjson and the stdlib fallback produce identical bytes."""
+        annotation_cases = {
+            'text_and_numpy': {'site': 'Baile Átha Cliath', 'satellites': np.int64(18)},
+            'non_finite_floats': {'gimbal_pitch': float('nan'), 'speeds': np.array([4.5, np.inf])},
+            'integer_beyond_64_bits': {'serial': 2 ** 70},
+        }
+        for case, annotations in annotation_cases.items():
+            with self.subTest(case):
+                report = _make_report()
+                report.automated_annotations = annotations
+
+                with mock.patch.object(cli, 'ORJSON_AVAILABLE', False):
+                    fallback = _dump_report(report)
+
+                self.assertEqual(_dump_report(report), fallback)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DatasetIndexGenerator formatter.
+
+This module covers the dataset index, mission README and processing
+report files generated for a batch of videos.
+"""
+
+import unittest
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from drone_metadata.formatters.base_formatter import FormatterConfig
+from drone_metadata.formatters.dataset_index_generator import DatasetIndexGenerator, _open_utf8_writer
+from drone_metadata.models import MissionType, VideoProcessingBatch
+from tests.conftest import make_result
+
+
+class TestDatasetIndexGenerator(unittest.TestCase):
+    """Test cases for dataset index generation."""
+
+    def setUp(self):
+        """Create a generator writing into a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self._tmp.name)
+        self.generator = DatasetIndexGenerator(FormatterConfig(output_directory=str(self.output_dir)))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _make_batch(self) -> VideoProcessingBatch:
+        batch = VideoProcessingBatch(batch_id="test_batch", processing_start=datetime(2025, 1, 1, 10, 0, 0))
+        batch.add_result(make_result("DJI_0001.MP4", MissionType.BOX))
+        batch.add_result(make_result("DJI_0002.MP4"))
+        batch.add_result(make_result("DJI_0003.MP4", MissionType.BOX))
+        return batch
+
+    def test_format_batch_groups_unclassified_videos(self):
+        """Test that videos without mission data get an 'unknown' mission README."""
+        paths = self.generator.format_batch(self._make_batch())
+
+        self.assertEqual(
+            [p.name for p in paths],
+            ["DATASET_INDEX.md", "box_README.md", "unknown_README.md", "PROCESSING_REPORT.txt"]
+        )
+
+        unknown_readme = (self.output_dir / "unknown_README.md").read_text(encoding="utf-8")
+        self.assertIn("# Unknown Mission Videos", unknown_readme)
+        self.assertIn("### DJI_0002.MP4", unknown_readme)
+
+        box_readme = (self.output_dir / "box_README.md").read_text(encoding="utf-8")
+        self.assertIn("- **Video Count**: 2", box_readme)
+        self.assertIn("- **Total Duration**: 2m 30s", box_readme)
+
+        index = (self.output_dir / "DATASET_INDEX.md").read_text(encoding="utf-8")
+        self.assertIn("- **Box**: 2 videos (66.7%)", index)
+        self.assertIn("- `DJI_0002.MP4` - 01:15, 2.0MB, unknown, No GPS", index)
+
+        report = (self.output_dir / "PROCESSING_REPORT.txt").read_text(encoding="utf-8")
+        self.assertIn("    Duration: 01:15\n\n 2. DJI_0002.MP4\n", report)
+        self.assertTrue(report.endswith(" 3. DJI_0003.MP4\n    Status: SUCCESS\n    Size: 2.00 MB\n    Duration: 01:15\n"))
+
+    def test_format_batch_keeps_existing_files(self):
+        """Test that existing outputs are returned untouched when overwrite is disabled."""
+        batch = self._make_batch()
+        first_paths = self.generator.format_batch(batch)
+        index_path = self.output_dir / "DATASET_INDEX.md"
+        index_path.write_text("existing", encoding="utf-8")
+
+        second_paths = self.generator.format_batch(batch)
+
+        self.assertEqual(second_paths, first_paths)
+        self.assertEqual(index_path.read_text(encoding="utf-8"), "existing")
+
+    def test_failed_write_leaves_no_partial_file(self):
+        """Test that a document is not left truncated on disk when writing fails part way."""
+        index_path = self.output_dir / "DATASET_INDEX.md"
+
+        with self.assertRaises(RuntimeError):
+            with _open_utf8_writer(index_path) as w:
+                w("# Dataset Index\n")
+                raise RuntimeError("generation failed")
+
+        self.assertEqual(list(self.output_dir.iterdir()), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
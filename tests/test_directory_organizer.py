@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the DirectoryOrganizer formatter.
+
+This module covers the mission directory structure and the organized
+output paths created under the output directory.
+"""
+
+import logging
+import os
+import unittest
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from drone_metadata.formatters.base_formatter import FormatterConfig
+from drone_metadata.formatters.directory_organizer import DirectoryOrganizer
+from drone_metadata.models import MissionType, VideoProcessingBatch
+from tests.conftest import make_result
+
+
+class TestDirectoryOrganizer(unittest.TestCase):
+    """Test cases for mission-based directory organization."""
+
+    def setUp(self):
+        """Work from a temporary directory so relative output paths stay inside it."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        self.work_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_relative_output_directory_is_not_nested(self):
+        """Test that a relative output directory is not repeated in organized paths."""
+        organizer = DirectoryOrganizer(FormatterConfig(output_directory="out"))
+
+        path = organizer.get_organized_output_path(make_result("DJI_0001.MP4", MissionType.BOX), ".md")
+
+        self.assertEqual(path, Path("out") / "box" / "metadata" / "DJI_0001.MP4.md")
+        self.assertTrue((self.work_dir / "out" / "box" / "metadata").is_dir())
+        self.assertTrue((self.work_dir / "out" / "box" / "metadata" / "thumbnails").is_dir())
+        self.assertTrue((self.work_dir / "out" / "box" / "semantic").is_dir())
+        self.assertFalse((self.work_dir / "out" / "out").exists())
+
+    def test_format_batch_splits_files_between_prefix_stems(self):
+        """Test that each file is organized once, by the video with the longest matching stem."""
+        organized_by_video = {}
+
+        class RecordingOrganizer(DirectoryOrganizer):
+            def format_single_video(self, result):
+                paths = super().format_single_video(result)
+                organized_by_video[result.video_metadata.filename] = sorted(path.name for path in paths)
+                return paths
+
+        organizer = RecordingOrganizer(FormatterConfig(output_directory="out"))
+        for name in ("DJI_001.MP4.md", "DJI_0010.MP4.md", "DJI_0010.json"):
+            (self.work_dir / "out" / name).write_text(name, encoding="utf-8")
+        batch = VideoProcessingBatch(batch_id="test_batch", processing_start=datetime(2025, 1, 1, 10, 0, 0))
+        batch.add_result(make_result("DJI_001.MP4", MissionType.BOX))
+        batch.add_result(make_result("DJI_0010.MP4", MissionType.BOX))
+
+        with self.assertNoLogs("drone_metadata.formatters.directory_organizer", level=logging.ERROR):
+            organizer.format_batch(batch)
+
+        self.assertEqual(organized_by_video, {
+            "DJI_001.MP4": ["DJI_001.MP4.md"],
+            "DJI_0010.MP4": ["DJI_0010.MP4.md", "DJI_0010.json"],
+        })
+        self.assertEqual(len(organizer.organized_files), 3)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SemanticModelExporter formatter.
+
+This module covers the CSV formatting of the semantic model fact and
+dimension tables.
+"""
+
+import csv
+import io
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from drone_metadata.formatters.base_formatter import FormatterConfig
+from drone_metadata.formatters.semantic_model_exporter import SemanticModelExporter, _format_csv_rows
+from drone_metadata.models import MissionType
+from tests.conftest import make_result
+
+
+class TestSemanticModelExporter(unittest.TestCase):
+    """Test cases for semantic model CSV export."""
+
+    def test_format_csv_rows_matches_csv_writer(self):
+        """Test that hand-formatted rows are identical to csv.writer output."""
+        rows = [
+            ["flight_001", "DJI_0001.MP4", 12.5, None, True],
+            ["flight_002", "a,b.MP4", 'say "hi"', "line\nbreak", ""],
+            ["flight_003", "é.MP4", 0, -6.5, "carriage\rreturn"],
+        ]
+        expected = io.StringIO()
+        csv.writer(expected).writerows(rows)
+
+        self.assertEqual(_format_csv_rows(rows), expected.getvalue())
+        self.assertEqual(_format_csv_rows([]), "")
+
+    def test_flight_facts_quotes_filenames(self):
+        """Test that flight_facts.csv round-trips through the csv reader."""
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = SemanticModelExporter(FormatterConfig(output_directory=tmp))
+            exporter.format_single_video(make_result('Bay 1, "north".MP4', MissionType.BOX, bay="Bay 1", with_gps=True))
+            with open(Path(tmp) / "flight_facts.csv", newline='', encoding='utf-8') as csvfile:
+                rows = list(csv.reader(csvfile))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][:4], ["flight_001", 'Bay 1, "north".MP4', "75.0", "2.0"])
+        self.assertEqual(rows[1][7:12], ["53.3", "-6.2", "40.0", "box", "Bay 1"])
+
+    def test_altitude_dimension_matches_flight_facts(self):
+        """Test that altitudes are written the same way in the fact and dimension tables."""
+        result = make_result("DJI_0001.MP4", MissionType.BOX, bay="Bay 1", with_gps=True)
+        result.gps_data.altitude_meters = 40
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = SemanticModelExporter(FormatterConfig(output_directory=tmp))
+            exporter.format_single_video(result)
+            with open(Path(tmp) / "flight_facts.csv", newline='', encoding='utf-8') as csvfile:
+                facts = list(csv.reader(csvfile))
+            with open(Path(tmp) / "altitude_dimension.csv", newline='', encoding='utf-8') as csvfile:
+                altitudes = list(csv.reader(csvfile))
+
+        self.assertEqual(facts[1][9], "40")
+        self.assertEqual(altitudes[1], ["alt_001", "40", "low"])
+
+    def test_unchanged_dimension_tables_are_kept(self):
+        """Test that unchanged dimension tables are skipped, and edited ones rewritten, when overwriting."""
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = SemanticModelExporter(FormatterConfig(output_directory=tmp, overwrite_existing=True))
+            exporter.format_single_video(make_result("DJI_0001.MP4", MissionType.BOX, bay="Bay 1", with_gps=True))
+            bay_path = Path(tmp) / "bay_dimension.csv"
+            self.assertTrue((Path(tmp) / "bay_dimension.csv.hash").exists())
+            written_mtime = bay_path.stat().st_mtime_ns
+
+            with self.assertLogs(exporter.logger, level="INFO") as logs:
+                exporter.format_single_video(make_result("DJI_0002.MP4", MissionType.BOX, bay="Bay 1", with_gps=True))
+            self.assertEqual(bay_path.stat().st_mtime_ns, written_mtime)
+            self.assertTrue(any("Dimension values unchanged" in line and "bay_dimension" in line
+                                for line in logs.output))
+            self.assertIn("DJI_0002.MP4", (Path(tmp) / "flight_facts.csv").read_text(encoding="utf-8"))
+
+            bay_path.write_text("edited", encoding="utf-8")
+            exporter.format_single_video(make_result("DJI_0002.MP4", MissionType.BOX, bay="Bay 1", with_gps=True))
+            self.assertIn("bay_001,Bay 1,inspection_bay", bay_path.read_text(encoding="utf-8"))
+
+            exporter.format_single_video(make_result("DJI_0003.MP4", MissionType.BOX, bay="Bay 2", with_gps=True))
+            self.assertIn("bay_001,Bay 2,inspection_bay", bay_path.read_text(encoding="utf-8"))
+
+    def test_existing_dimension_tables_are_kept_without_overwrite(self):
+        """Test that an existing dimension table is kept when overwrite is disabled."""
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = SemanticModelExporter(FormatterConfig(output_directory=tmp))
+            exporter.format_single_video(make_result("DJI_0001.MP4", MissionType.BOX, bay="Bay 1", with_gps=True))
+            bay_path = Path(tmp) / "bay_dimension.csv"
+            bay_path.write_text("edited", encoding="utf-8")
+
+            exporter.format_single_video(make_result("DJI_0002.MP4", MissionType.BOX, bay="Bay 2", with_gps=True))
+            self.assertEqual(bay_path.read_text(encoding="utf-8"), "edited")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)